@@ -1,12 +1,17 @@
 """Configuration module for skill scraper."""
 
-from dataclasses import dataclass, field
-from typing import Literal
+import functools
+from dataclasses import dataclass
+from typing import Literal, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExtractionConfig:
-    """Configuration for skill extraction behavior."""
+    """Configuration for skill extraction behavior.
+
+    Instances are immutable; derive a modified copy with
+    ``dataclasses.replace``. The preset factories return shared instances.
+    """
 
     mode: Literal["metadata", "extract", "both"] = "metadata"
     """How to handle skill repositories:
@@ -33,9 +38,23 @@ class ExtractionConfig:
     clone_depth: int = 1
     """Git clone depth (1 = shallow clone for speed)"""
 
+    clone_jobs: int = 4
+    """Number of submodules to fetch in parallel when recursing into submodules"""
+
+    recurse_submodules: bool = False
+    """Also clone (shallow) submodules, for skills that live inside them"""
+
+    jobs: int = 8
+    """Number of repositories to clone and extract concurrently"""
+
     temp_dir: str = "/tmp/skill-scraper-clone"
     """Temporary directory for cloning repositories"""
 
+    staging_fs: Optional[str] = None
+    """Directory to hold clones and staged skills, e.g. ``/dev/shm`` to keep
+    clone I/O in memory (default: clones in the system temp dir, staged
+    skills next to the skills dir so installs are a rename)"""
+
     selection_mode: Literal["auto", "manual"] = "manual"
     """Post-extraction skill selection mode:
     - auto: Automatically install all extracted skills
@@ -57,16 +76,19 @@ class ExtractionConfig:
         return cls()
 
     @classmethod
+    @functools.cache
     def metadata_only(cls) -> "ExtractionConfig":
         """Quick mode - metadata only."""
         return cls(mode="metadata", auto_detect=False)
 
     @classmethod
+    @functools.cache
     def extract_all(cls) -> "ExtractionConfig":
         """Full extraction mode."""
         return cls(mode="extract", auto_detect=True, confirm_extraction=False)
 
     @classmethod
+    @functools.cache
     def smart_mode(cls) -> "ExtractionConfig":
         """Smart mode - detect and ask."""
         return cls(mode="both", auto_detect=True, confirm_extraction=True)
@@ -1,10 +1,22 @@
 """Example usage of the skill scraper programmatically."""
 
+from typing import Optional
+
 from loguru import logger
 from scraper import RepoScraper
 from storage import RepoStorage
 from skill_generator import SkillGenerator
 
+_skill_gen: Optional[SkillGenerator] = None
+
+
+def get_skill_generator() -> SkillGenerator:
+    """Return the generator shared by the examples, creating it on first use."""
+    global _skill_gen
+    if _skill_gen is None:
+        _skill_gen = SkillGenerator()
+    return _skill_gen
+
 
 def example_scrape_and_install():
     """Example: Scrape an awesome list and install specific skills."""
@@ -12,7 +24,7 @@ def example_scrape_and_install():
 
     scraper = RepoScraper()
     storage = RepoStorage("example_repos.json")
-    skill_gen = SkillGenerator()
+    skill_gen = get_skill_generator()
 
     awesome_url = "https://github.com/sindresorhus/awesome-python"
     logger.info(f"Scraping {awesome_url}")
@@ -20,9 +32,8 @@ def example_scrape_and_install():
     repos = scraper.scrape_awesome_repo(awesome_url)
     logger.info(f"Found {len(repos)} repositories")
 
-    for i, repo in enumerate(repos[:5]):
-        logger.info(f"Fetching details for {repo['full_name']} ({i+1}/5)")
-        scraper.fetch_repo_details(repo)
+    logger.info(f"Fetching details for {len(repos[:5])} repositories")
+    scraper.fetch_many(repos[:5])
 
     storage.save_repos(repos)
     logger.info(f"Saved {len(repos)} repositories")
@@ -55,7 +66,7 @@ def example_load_and_filter():
     python_repos = [r for r in repos if 'python' in r.get('description', '').lower()]
     logger.info(f"Found {len(python_repos)} Python-related repositories")
 
-    skill_gen = SkillGenerator()
+    skill_gen = get_skill_generator()
 
     for repo in python_repos[:5]:
         skill_gen.generate_skill(repo)
@@ -65,7 +76,7 @@ def example_load_and_filter():
 
 def example_list_skills():
     """Example: List all installed skills."""
-    skill_gen = SkillGenerator()
+    skill_gen = get_skill_generator()
     skills = skill_gen.list_installed_skills()
 
     logger.info(f"Found {len(skills)} installed skills:")
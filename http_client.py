@@ -0,0 +1,89 @@
+"""Shared HTTP client configuration for GitHub requests."""
+
+import importlib.util
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+import httpx
+
+DEFAULT_WORKERS = 16
+"""Default number of concurrent requests issued by the scraper and detector"""
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
+
+
+def create_client() -> httpx.Client:
+    """
+    Create an HTTP client tuned for many small requests to GitHub.
+
+    The client is thread-safe and meant to be shared, so README fetches and
+    API calls reuse one connection pool. HTTP/2 is enabled when ``h2`` is
+    installed, and ``GITHUB_TOKEN`` is sent when set to raise the API rate
+    limit.
+
+    Returns:
+        Configured httpx client
+    """
+    headers = {"User-Agent": USER_AGENT}
+
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"bearer {token}"
+
+    return httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=httpx.Timeout(30.0, connect=10.0),
+        limits=httpx.Limits(
+            max_connections=64,
+            # Room for every worker to keep a connection to both
+            # raw.githubusercontent.com and api.github.com.
+            max_keepalive_connections=2 * DEFAULT_WORKERS,
+            keepalive_expiry=30.0
+        ),
+        follow_redirects=True,
+        headers=headers
+    )
+
+
+@contextmanager
+def open_readme(
+    client: httpx.Client,
+    owner: str,
+    name: str,
+    branch_cache: Dict[str, str]
+) -> Iterator[httpx.Response]:
+    """
+    Open a streamed README response from raw.githubusercontent.com.
+
+    Tries the cached default branch first; on a miss probes ``main`` and
+    falls back to ``master``, remembering whichever one answered in
+    ``branch_cache`` so later requests for the same repository cost a single
+    round trip. The body is not read, so callers can stop consuming it early.
+
+    Args:
+        client: HTTP client to send the request with
+        owner: Repository owner
+        name: Repository name
+        branch_cache: Default branches keyed by ``owner/name``, shared
+            between everything that fetches from the same repositories
+    """
+    repo_key = f"{owner}/{name}"
+    cached_branch = branch_cache.get(repo_key)
+    branches = [cached_branch] if cached_branch else ["main", "master"]
+
+    for branch in branches:
+        request = client.build_request(
+            "GET", f"https://raw.githubusercontent.com/{owner}/{name}/{branch}/README.md"
+        )
+        response = client.send(request, stream=True)
+        if response.status_code != 404 or branch == branches[-1]:
+            break
+        response.close()
+
+    try:
+        if response.is_success:
+            branch_cache[repo_key] = branch
+        yield response
+    finally:
+        response.close()
@@ -1,27 +1,32 @@
 """Main entry point for skill scraper workflow."""
 
 import sys
+from dataclasses import replace
 from loguru import logger
 from rich.console import Console
 from rich.panel import Panel
 from rich import box
 
+from http_client import create_client
 from scraper import RepoScraper
-from storage import RepoStorage
+from storage import open_storage
 from ui import RepoSelector
 from skill_generator import SkillGenerator
-from skill_detector import SkillDetector
+from skill_detector import SkillDetector, count_skill_repos
 from skill_extractor import SkillExtractor
 from config import ExtractionConfig
 
 console = Console()
 
 
+LOG_FILE = "skill_scraper.log"
+
+
 def setup_logging():
     """Configure loguru logger."""
     logger.remove()
     logger.add(
-        "skill_scraper.log",
+        LOG_FILE,
         rotation="10 MB",
         retention="7 days",
         level="DEBUG",
@@ -56,11 +61,13 @@ def main():
     show_banner()
     logger.info("Starting skill scraper workflow")
 
-    scraper = RepoScraper()
-    storage = RepoStorage()
+    client = create_client()
+    branch_cache = {}  # owner/name -> default branch, shared to skip main/master probes
+    scraper = RepoScraper(client=client, branch_cache=branch_cache)
+    storage = open_storage()
     ui = RepoSelector()
     skill_gen = SkillGenerator()
-    detector = SkillDetector()
+    detector = SkillDetector(client=client, branch_cache=branch_cache)
     extractor = None
 
     try:
@@ -93,15 +100,16 @@ def main():
                 logger.info("Fetching repository details...")
                 console.print()  # Space before progress bar
 
-                with ui.show_progress("Fetching repository details", len(repos)) as progress:
+                with ui.show_progress("Fetching repository details") as progress:
                     task = progress.add_task("[cyan]Fetching descriptions...", total=len(repos))
 
-                    for i, repo in enumerate(repos):
-                        progress.update(task, description=f"[cyan]Fetching: {repo['full_name']}")
-                        logger.debug(f"Fetching details for {repo['full_name']} ({i+1}/{len(repos)})")
-                        scraper.fetch_repo_details(repo)
+                    def on_fetched(repo):
+                        progress.update(task, description=f"[cyan]Fetched: {repo['full_name']}")
+                        logger.debug("Fetched details for {}", repo['full_name'])
                         progress.advance(task)
 
+                    scraper.fetch_repo_details_batch(repos, on_complete=on_fetched)
+
                 console.print()  # Space after progress bar
 
             merge_repos = False
@@ -132,7 +140,7 @@ def main():
         config = ui.select_extraction_mode()
 
         if config.mode in ["extract", "both", "metadata"]:
-            config.update_existing = ui.confirm_skill_update()
+            config = replace(config, update_existing=ui.confirm_skill_update())
 
         extractor = SkillExtractor(config=config)
 
@@ -142,17 +150,18 @@ def main():
             logger.info("Detecting skill repositories...")
             console.print()  # Space before progress bar
 
-            with ui.show_progress("Detecting skill repositories", len(repos)) as progress:
+            with ui.show_progress("Detecting skill repositories") as progress:
                 task = progress.add_task("[yellow]Analyzing repositories...", total=len(repos))
 
-                for i, repo in enumerate(repos):
-                    progress.update(task, description=f"[yellow]Checking: {repo['full_name']}")
-                    logger.debug(f"Checking {repo['full_name']} ({i+1}/{len(repos)})")
-                    detection_results[repo['full_name']] = detector.detect_skills(repo)
+                def on_detected(repo):
+                    progress.update(task, description=f"[yellow]Checked: {repo['full_name']}")
+                    logger.debug("Checked {}", repo['full_name'])
                     progress.advance(task)
 
+                detection_results = detector.detect_many(repos, on_complete=on_detected)
+
             console.print()  # Space after progress bar
-            skill_repo_count = sum(1 for r in detection_results.values() if r.get('is_skill_repo'))
+            skill_repo_count = count_skill_repos(detection_results)
             ui.print_status(f"✓ Detected [green]{skill_repo_count}[/green] skill repositories\n", style="bold")
 
         selected = ui.select_repos(repos, detection_results)
@@ -169,11 +178,12 @@ def main():
         failed = 0
         total_extracted = 0
 
-        with ui.show_progress("Extracting skills", len(selected)) as progress:
+        with ui.show_progress("Extracting skills") as progress:
             task = progress.add_task("[green]Extracting skills...", total=len(selected))
 
+            # Decide up front so confirmation prompts stay sequential.
+            to_extract = []
             for repo in selected:
-                progress.update(task, description=f"[green]Processing: {repo['full_name']}")
                 repo_full_name = repo['full_name']
                 is_skill_repo = detection_results.get(repo_full_name, {}).get('is_skill_repo', False)
 
@@ -188,28 +198,48 @@ def main():
                         should_extract = is_skill_repo
 
                 if should_extract:
-                    logger.info(f"Extracting skills from {repo_full_name}...")
-                    extraction_result = extractor.extract_skills(
-                        repo,
-                        detection_results.get(repo_full_name, {})
-                    )
+                    to_extract.append(repo)
 
-                    if extraction_result['success']:
-                        total_extracted += extraction_result['extracted_count']
-                        logger.info(
-                            f"Extracted {extraction_result['extracted_count']} skills "
-                            f"from {repo_full_name}"
-                        )
-                    else:
-                        logger.warning(f"Failed to extract skills from {repo_full_name}")
+            def on_extracted(repo, extraction_result):
+                progress.update(task, description=f"[green]Extracted: {repo['full_name']}")
+                if config.mode not in ["metadata", "both"]:
+                    progress.advance(task)
 
-                if config.mode in ["metadata", "both"]:
-                    if skill_gen.generate_skill(repo, update=config.update_existing):
-                        successful += 1
-                    else:
-                        failed += 1
+            to_extract = extractor.filter_new(to_extract, detection_results)
+
+            logger.info(f"Extracting skills from {len(to_extract)} repositories...")
+            extraction_results = extractor.extract_skills_batch(
+                to_extract,
+                detection_results,
+                on_complete=on_extracted
+            )
+
+            for repo_full_name, extraction_result in extraction_results.items():
+                if extraction_result['success']:
+                    total_extracted += extraction_result['extracted_count']
+                    logger.info(
+                        f"Extracted {extraction_result['extracted_count']} skills "
+                        f"from {repo_full_name}"
+                    )
+                else:
+                    logger.warning(f"Failed to extract skills from {repo_full_name}")
 
-                progress.advance(task)
+            if config.mode in ["metadata", "both"]:
+                def on_generated(repo, success):
+                    progress.update(task, description=f"[green]Processing: {repo['full_name']}")
+                    progress.advance(task)
+
+                generated = skill_gen.generate_skills(
+                    selected,
+                    update=config.update_existing,
+                    on_complete=on_generated
+                )
+                successful = sum(generated)
+                failed = len(generated) - successful
+            else:
+                for repo in selected:
+                    if repo['full_name'] not in extraction_results:
+                        progress.advance(task)
 
         console.print()  # Space after progress bar
 
@@ -282,6 +312,7 @@ def main():
     finally:
         scraper.close()
         detector.close()
+        client.close()
         if extractor:
             extractor.cleanup_staging()
 
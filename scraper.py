@@ -1,26 +1,55 @@
 """GitHub repository scraper for awesome-* lists."""
 
+import hashlib
+import os
 import re
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, ContextManager, Iterable, List, Dict, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
 
+from http_client import DEFAULT_WORKERS, create_client, open_readme
+
+try:
+    import re2 as url_re
+except ImportError:
+    url_re = re
+
 
 class RepoScraper:
     """Scrapes GitHub repositories from awesome-* lists."""
 
-    def __init__(self):
-        self.client = httpx.Client(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"}
-        )
-        self.github_pattern = re.compile(
-            r'https?://(?:www\.)?github\.com/([^/]+)/([^/#?\s)]+)'
-        )
+    _GITHUB_URL_PATTERN = r'https?://(?:www\.)?github\.com/([^/\s]+)/([^/#?\s),;:]*[^/#?\s).,;:])'
+    _GITHUB_URL_RE = url_re.compile(_GITHUB_URL_PATTERN)
+    _GITHUB_URL_BYTES_RE = url_re.compile(_GITHUB_URL_PATTERN.encode())
+    _LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+    _EMPHASIS_TABLE = str.maketrans('', '', '*_`')
+    _SKIP_PREFIXES = ('#', '[![', '![')
+    _MAX_CANDIDATES = 5
+    _FETCH_WORKERS = DEFAULT_WORKERS
+    _PARSE_CACHE_SIZE = 256
+    _GRAPHQL_URL = "https://api.github.com/graphql"
+    _GRAPHQL_BATCH_SIZE = 100
+    _GRAPHQL_REPO_FIELDS = """
+        description
+        defaultBranchRef { name }
+        skillMd: object(expression: "HEAD:SKILL.md") { ... on Blob { oid } }
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.Client] = None,
+        branch_cache: Optional[Dict[str, str]] = None
+    ):
+        self._owns_client = client is None
+        self.client = client or create_client()
+        self.github_pattern = self._GITHUB_URL_RE
+        self._branch_cache: Dict[str, str] = {} if branch_cache is None else branch_cache
+        self._repos_cache: Dict[bytes, Tuple[Tuple[str, str, str], ...]] = {}
+        self._cache_lock = threading.Lock()
 
     def scrape_awesome_repo(self, github_url: str) -> List[Dict[str, str]]:
         """
@@ -42,55 +71,94 @@ class RepoScraper:
             return []
 
         owner, repo = path_parts[0], path_parts[1]
-        raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/README.md"
 
         try:
-            response = self.client.get(raw_url)
-            if response.status_code == 404:
-                raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/master/README.md"
-                response = self.client.get(raw_url)
+            with self._open_readme(owner, repo) as response:
+                response.raise_for_status()
+                content = response.read()
 
-            response.raise_for_status()
-            content = response.text
-
-            logger.info(f"Successfully fetched README from {raw_url}")
+            logger.info(f"Successfully fetched README from {response.url}")
             return self._extract_repos(content)
 
         except httpx.HTTPError as e:
-            logger.error(f"Failed to fetch {raw_url}: {e}")
+            logger.error(f"Failed to fetch README for {owner}/{repo}: {e}")
             return []
 
-    def _extract_repos(self, markdown_content: str) -> List[Dict[str, str]]:
-        """Extract GitHub repositories from markdown content."""
-        repos = []
-        seen = set()
-
-        matches = self.github_pattern.finditer(markdown_content)
-
-        for match in matches:
-            full_url = match.group(0)
-            owner = match.group(1)
-            repo_name = match.group(2)
-
-            repo_name = repo_name.rstrip('.')
-
-            repo_key = f"{owner}/{repo_name}"
+    def _open_readme(self, owner: str, name: str) -> ContextManager[httpx.Response]:
+        """Open a streamed README response, reusing the known default branch."""
+        return open_readme(self.client, owner, name, self._branch_cache)
+
+    @staticmethod
+    def _content_key(content: Union[str, bytes]) -> bytes:
+        """Digest README content into a compact cache key."""
+        if isinstance(content, str):
+            content = content.encode()
+        return hashlib.blake2b(content, digest_size=16).digest()
+
+    def _cache_store(self, cache: Dict, key: bytes, value) -> None:
+        """Store a parse result, evicting the oldest entry once the cache is full."""
+        with self._cache_lock:
+            if len(cache) >= self._PARSE_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = value
+
+    def _extract_repos(self, markdown_content: Union[str, bytes]) -> List[Dict[str, str]]:
+        """
+        Extract GitHub repositories from markdown content.
 
-            if repo_key in seen:
-                continue
+        Raw response bytes are matched with a bytes pattern, so only the
+        captured owners and names are ever decoded.
+        """
+        key = self._content_key(markdown_content)
+        matches = self._repos_cache.get(key)
 
-            seen.add(repo_key)
+        if matches is None:
+            matches = self._parse_repo_matches(markdown_content)
+            self._cache_store(self._repos_cache, key, matches)
 
-            repos.append({
+        repos: List[Dict[str, str]] = [
+            {
                 "owner": owner,
                 "name": repo_name,
                 "full_name": repo_key,
-                "url": f"https://github.com/{repo_key}",
-            })
+                "url": "https://github.com/" + repo_key,
+            }
+            for owner, repo_name, repo_key in matches
+        ]
 
         logger.info(f"Extracted {len(repos)} unique repositories")
         return repos
 
+    def _parse_repo_matches(self, markdown_content: Union[str, bytes]) -> Tuple[Tuple[str, str, str], ...]:
+        """Find unique (owner, name, full_name) triples linked from markdown content."""
+        matches: List[Tuple[str, str, str]] = []
+        seen: Set[Union[str, bytes]] = set()
+
+        is_bytes = isinstance(markdown_content, bytes)
+        if (b'github.com/' if is_bytes else 'github.com/') not in markdown_content:
+            return ()
+
+        pattern = self._GITHUB_URL_BYTES_RE if is_bytes else self.github_pattern
+        sep = b'/' if is_bytes else '/'
+
+        for match in pattern.finditer(markdown_content):
+            owner, repo_name = match.group(1, 2)
+            repo_key = owner + sep + repo_name
+            # GitHub names are case-insensitive; first spelling seen wins.
+            dedup_key = repo_key.lower()
+
+            if dedup_key in seen:
+                continue
+
+            seen.add(dedup_key)
+            if is_bytes:
+                owner = owner.decode('utf-8', errors='replace')
+                repo_name = repo_name.decode('utf-8', errors='replace')
+                repo_key = owner + '/' + repo_name
+            matches.append((owner, repo_name, repo_key))
+
+        return tuple(matches)
+
     def fetch_repo_details(self, repo: Dict[str, str]) -> Dict[str, str]:
         """
         Fetch additional details about a repository from its README.
@@ -101,21 +169,11 @@ class RepoScraper:
         Returns:
             Updated repository dictionary with description
         """
-        owner = repo["owner"]
-        name = repo["name"]
-
-        raw_url = f"https://raw.githubusercontent.com/{owner}/{name}/main/README.md"
-
         try:
-            response = self.client.get(raw_url)
-            if response.status_code == 404:
-                raw_url = f"https://raw.githubusercontent.com/{owner}/{name}/master/README.md"
-                response = self.client.get(raw_url)
+            with self._open_readme(repo["owner"], repo["name"]) as response:
+                response.raise_for_status()
+                first_paragraph = self._first_paragraph_from_lines(response.iter_lines())
 
-            response.raise_for_status()
-            content = response.text
-
-            first_paragraph = self._extract_first_paragraph(content)
             repo["description"] = first_paragraph or "No description available"
 
         except httpx.HTTPError as e:
@@ -124,36 +182,161 @@ class RepoScraper:
 
         return repo
 
-    def _extract_first_paragraph(self, markdown: str) -> str:
-        """Extract the first meaningful paragraph from markdown."""
-        lines = markdown.split('\n')
+    def fetch_many(
+        self,
+        repos: List[Dict[str, str]],
+        max_workers: int = _FETCH_WORKERS,
+        on_complete: Optional[Callable[[Dict[str, str]], None]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Fetch details for many repositories concurrently.
+
+        Each fetch is an independent network round trip, so they are spread
+        over a thread pool. ``httpx.Client`` is thread-safe, and the workers
+        share this scraper's connection pool, which is sized so that the
+        default worker count never waits for a free keep-alive connection.
+
+        Args:
+            repos: Repository dictionaries to update in place
+            max_workers: Maximum number of concurrent fetches
+            on_complete: Optional callback invoked with each repo once fetched
+
+        Returns:
+            The same list of repositories, updated with descriptions
+        """
+        if not repos:
+            return repos
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repos))) as executor:
+            futures = [executor.submit(self.fetch_repo_details, repo) for repo in repos]
+
+            for future in as_completed(futures):
+                repo = future.result()
+                if on_complete:
+                    on_complete(repo)
+
+        return repos
+
+    def fetch_repo_details_batch(
+        self,
+        repos: List[Dict[str, str]],
+        token: Optional[str] = None,
+        on_complete: Optional[Callable[[Dict[str, str]], None]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Fetch details for many repositories via the GitHub GraphQL API.
+
+        Up to 100 repositories are resolved per request, returning each
+        repository's description, default branch and whether it has a
+        top-level SKILL.md. Repositories the API has no description for fall
+        back to README scraping. Without a token (``token`` or the
+        ``GITHUB_TOKEN`` environment variable) this is equivalent to
+        ``fetch_many``.
+
+        Args:
+            repos: Repository dictionaries to update in place
+            token: GitHub token used to authenticate GraphQL requests
+            on_complete: Optional callback invoked with each repo once fetched
+
+        Returns:
+            The same list of repositories, updated with descriptions
+        """
+        token = token or os.environ.get("GITHUB_TOKEN")
+        if not token:
+            return self.fetch_many(repos, on_complete=on_complete)
+
+        needs_readme = []
+
+        for start in range(0, len(repos), self._GRAPHQL_BATCH_SIZE):
+            batch = repos[start:start + self._GRAPHQL_BATCH_SIZE]
+
+            try:
+                nodes = self._query_repositories(batch, token)
+            except (httpx.HTTPError, ValueError) as e:
+                logger.warning(f"GraphQL lookup failed, falling back to READMEs: {e}")
+                needs_readme.extend(batch)
+                continue
+
+            for repo, node in zip(batch, nodes):
+                if not node:
+                    needs_readme.append(repo)
+                    continue
+
+                if node.get("defaultBranchRef"):
+                    self._branch_cache[repo["full_name"]] = node["defaultBranchRef"]["name"]
+                repo["has_skill_md"] = node.get("skillMd") is not None
+
+                if not node.get("description"):
+                    needs_readme.append(repo)
+                    continue
+
+                repo["description"] = node["description"]
+                if on_complete:
+                    on_complete(repo)
+
+        self.fetch_many(needs_readme, on_complete=on_complete)
+        return repos
+
+    def _query_repositories(self, repos: List[Dict[str, str]], token: str) -> List[Optional[Dict]]:
+        """Resolve a batch of repositories in a single GraphQL request."""
+        params = []
+        fields = []
+        variables = {}
+
+        for i, repo in enumerate(repos):
+            params.append(f"$owner{i}: String!, $name{i}: String!")
+            fields.append(
+                f"r{i}: repository(owner: $owner{i}, name: $name{i}) {{{self._GRAPHQL_REPO_FIELDS}}}"
+            )
+            variables[f"owner{i}"] = repo["owner"]
+            variables[f"name{i}"] = repo["name"]
+
+        query = f"query({', '.join(params)}) {{\n" + "\n".join(fields) + "\n}"
+
+        response = self.client.post(
+            self._GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers={"Authorization": f"bearer {token}"}
+        )
+        response.raise_for_status()
+
+        data = response.json().get("data")
+        if data is None:
+            raise ValueError("GraphQL response contained no data")
+
+        return [data.get(f"r{i}") for i in range(len(repos))]
+
+    def _first_paragraph_from_lines(self, lines: Iterable[str]) -> str:
+        """
+        Pick the longest of the first few meaningful markdown lines.
+
+        Stops consuming ``lines`` as soon as enough candidates are found, so a
+        streamed README is only read as far as needed.
+        """
         candidates = []
 
         for line in lines:
             line = line.strip()
 
-            if line.startswith('#'):
-                continue
-            if line.startswith('[!['):
-                continue
-            if line.startswith('!['):
-                continue
-            if not line:
+            if not line or line.startswith(self._SKIP_PREFIXES):
                 continue
 
-            cleaned = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', line)
-            cleaned = re.sub(r'[*_`]', '', cleaned)
-            cleaned = cleaned.strip()
+            # Most prose lines carry no link; skip the regex for those.
+            cleaned = self._LINK_RE.sub(r'\1', line) if '](' in line else line
+            cleaned = cleaned.translate(self._EMPHASIS_TABLE).strip()
 
             if len(cleaned) > 20:
                 candidates.append(cleaned)
+                if len(candidates) == self._MAX_CANDIDATES:
+                    break
 
         if candidates:
-            best = max(candidates[:5], key=len)
+            best = max(candidates, key=len)
             return best[:200]
 
         return ""
 
     def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client unless it was passed in by the caller."""
+        if self._owns_client:
+            self.client.close()
@@ -1,20 +1,55 @@
 """Detector for identifying skill repositories."""
 
-from typing import Dict, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
+import os
 import re
 import httpx
 from loguru import logger
 
+from http_client import DEFAULT_WORKERS, create_client, open_readme
+
+_IS_SKILL_REPO = itemgetter("is_skill_repo")
+
+
+def count_skill_repos(detection_results: Dict[str, Dict]) -> int:
+    """Count the detection results that found a skill repository."""
+    # Every detection result carries a boolean is_skill_repo.
+    return sum(map(_IS_SKILL_REPO, detection_results.values()))
+
 
 class SkillDetector:
     """Detects if a repository contains Claude skills."""
 
-    def __init__(self):
-        self.client = httpx.Client(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"}
-        )
+    _SKILL_KEYWORDS = (
+        "claude skill", "claude code skill", "skill.md",
+        "skills folder", "skills directory", "claude agent skill"
+    )
+    # Zero-width lookahead so overlapping keywords (e.g. "claude skills folder")
+    # are all reported from a single scan. Matched case-insensitively on the
+    # raw README bytes, so the body is never decoded or lowercased.
+    _KEYWORD_RE = re.compile(
+        b"(?=(" + b"|".join(re.escape(keyword.encode()) for keyword in _SKILL_KEYWORDS) + b"))",
+        re.IGNORECASE
+    )
+
+    _GRAPHQL_URL = "https://api.github.com/graphql"
+    _BUNDLE_TREE_DEPTH = 4
+    """Directory levels fetched by the GraphQL bundle (covers skills/<name>/<dir>/)"""
+
+    def __init__(
+        self,
+        client: Optional[httpx.Client] = None,
+        branch_cache: Optional[Dict[str, str]] = None,
+        token: Optional[str] = None
+    ):
+        self._owns_client = client is None
+        self.client = client or create_client()
+        self._branch_cache: Dict[str, str] = {} if branch_cache is None else branch_cache
+        self._token = token or os.environ.get("GITHUB_TOKEN")
+        self._bundle_query = self._build_bundle_query(self._BUNDLE_TREE_DEPTH)
 
     def detect_skills(self, repo: Dict[str, str]) -> Dict[str, any]:
         """
@@ -39,11 +74,42 @@ class SkillDetector:
             "indicators": []
         }
 
-        readme_indicators = self._check_readme(owner, name)
+        bundle = self._fetch_repo_bundle(owner, name) if self._token else None
+        tree_paths = None
+
+        if bundle is None:
+            readme_indicators = self._check_readme(owner, name)
+        else:
+            readme_text, tree_paths = bundle
+            readme_indicators = self._readme_indicators(readme_text.encode()) if readme_text else []
+
         result["indicators"].extend(readme_indicators)
 
-        tree_indicators = self._check_repo_tree(owner, name)
-        result["indicators"].extend(tree_indicators)
+        if tree_paths is not None:
+            tree = (tree_paths, True)
+        elif repo.get("has_skill_md") and not self._token:
+            # The scraper's GraphQL lookup already found a top-level SKILL.md,
+            # so the whole repository is cloned either way. Without a token
+            # the tree costs an extra REST request, which would only refine
+            # the skill count; with one it comes with the bundle, or is
+            # worth fetching for an accurate count.
+            tree = None
+            result["indicators"].append({
+                "type": "repo_skill_md_files",
+                "value": 1,
+                "skill_count": 1,
+                "paths": ["SKILL.md"]
+            })
+        else:
+            tree = self._fetch_tree_paths(owner, name)
+
+        if tree is not None:
+            tree_paths, complete = tree
+            result["indicators"].extend(self._tree_indicators(tree_paths))
+            # Every SKILL.md in the repo; [] means there is nothing to clone
+            # for. Left out when the tree is unknown or truncated.
+            if complete:
+                result["skill_paths"] = [path for path in tree_paths if path.endswith("SKILL.md")]
 
         result["is_skill_repo"] = len(result["indicators"]) > 0
         result["confidence"] = min(len(result["indicators"]) * 0.3, 1.0)
@@ -62,101 +128,219 @@ class SkillDetector:
 
         return result
 
+    def detect_many(
+        self,
+        repos: List[Dict[str, str]],
+        max_workers: int = DEFAULT_WORKERS,
+        on_complete: Optional[Callable[[Dict[str, str]], None]] = None
+    ) -> Dict[str, Dict[str, any]]:
+        """
+        Detect skills in many repositories concurrently.
+
+        Detection is two network round trips per repository, so repositories
+        are checked in parallel over a thread pool sharing this detector's
+        HTTP client.
+
+        Args:
+            repos: Repository dictionaries with owner, name and full_name
+            max_workers: Maximum number of concurrent detections
+            on_complete: Optional callback invoked with each repo once checked
+
+        Returns:
+            Detection results keyed by full_name, in the order of ``repos``
+        """
+        if not repos:
+            return {}
+
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repos))) as executor:
+            futures = {executor.submit(self.detect_skills, repo): repo for repo in repos}
+
+            for future in as_completed(futures):
+                repo = futures[future]
+                results[repo["full_name"]] = future.result()
+                if on_complete:
+                    on_complete(repo)
+
+        return {repo["full_name"]: results[repo["full_name"]] for repo in repos}
+
     def _check_readme(self, owner: str, name: str) -> list:
         """Check README for skill repository indicators."""
         indicators = []
 
-        raw_url = f"https://raw.githubusercontent.com/{owner}/{name}/main/README.md"
-
         try:
-            response = self.client.get(raw_url)
-            if response.status_code == 404:
-                raw_url = f"https://raw.githubusercontent.com/{owner}/{name}/master/README.md"
-                response = self.client.get(raw_url)
+            with open_readme(self.client, owner, name, self._branch_cache) as response:
+                response.raise_for_status()
+                content = response.read()
 
-            response.raise_for_status()
-            content = response.text.lower()
-
-            skill_keywords = [
-                "claude skill", "claude code skill", "skill.md",
-                "skills folder", "skills directory", "claude agent skill"
-            ]
-
-            for keyword in skill_keywords:
-                if keyword in content:
-                    indicators.append({
-                        "type": "readme_keyword",
-                        "value": keyword,
-                        "skill_count": 1
-                    })
-
-            skill_md_count = len(re.findall(r'skill\.md', content, re.IGNORECASE))
-            if skill_md_count > 0:
-                indicators.append({
-                    "type": "readme_skill_md_mentions",
-                    "value": skill_md_count,
-                    "skill_count": skill_md_count
-                })
+            indicators = self._readme_indicators(content)
 
         except httpx.HTTPError as e:
             logger.debug(f"Could not fetch README for {owner}/{name}: {e}")
 
         return indicators
 
-    def _check_repo_tree(self, owner: str, name: str) -> list:
-        """Check repository structure via GitHub API."""
+    def _readme_indicators(self, content: bytes) -> list:
+        """Find skill indicators in raw README content."""
         indicators = []
 
-        tree_url = f"https://api.github.com/repos/{owner}/{name}/git/trees/main?recursive=1"
+        hits = Counter(match.group(1).lower() for match in self._KEYWORD_RE.finditer(content))
+
+        for keyword in self._SKILL_KEYWORDS:
+            if hits[keyword.encode()]:
+                indicators.append({
+                    "type": "readme_keyword",
+                    "value": keyword,
+                    "skill_count": 1
+                })
+
+        skill_md_count = hits[b"skill.md"]
+        if skill_md_count > 0:
+            indicators.append({
+                "type": "readme_skill_md_mentions",
+                "value": skill_md_count,
+                "skill_count": skill_md_count
+            })
+
+        return indicators
+
+    def _fetch_tree_paths(self, owner: str, name: str) -> Optional[Tuple[List[str], bool]]:
+        """
+        List the paths in a repository via the recursive Git Trees API.
+
+        Returns:
+            ``(paths, complete)``, where ``complete`` is False if GitHub
+            truncated the listing, or None if the tree could not be fetched
+        """
+        repo_key = f"{owner}/{name}"
+        cached_branch = self._branch_cache.get(repo_key)
+        branches = [cached_branch] if cached_branch else ["main", "master"]
 
         try:
-            response = self.client.get(tree_url)
-            if response.status_code == 404:
-                tree_url = f"https://api.github.com/repos/{owner}/{name}/git/trees/master?recursive=1"
+            for branch in branches:
+                tree_url = f"https://api.github.com/repos/{owner}/{name}/git/trees/{branch}?recursive=1"
                 response = self.client.get(tree_url)
+                if response.status_code != 404:
+                    break
+
+            if response.is_success:
+                self._branch_cache[repo_key] = branch
 
             if response.status_code == 403:
                 logger.debug(f"Rate limited on GitHub API for {owner}/{name}")
-                return indicators
+                return None
 
             response.raise_for_status()
             tree_data = response.json()
 
             if "tree" not in tree_data:
-                return indicators
-
-            skill_md_files = [
-                item for item in tree_data["tree"]
-                if item["path"].endswith("SKILL.md")
-            ]
+                return None
 
-            if skill_md_files:
-                indicators.append({
-                    "type": "repo_skill_md_files",
-                    "value": len(skill_md_files),
-                    "skill_count": len(skill_md_files),
-                    "paths": [item["path"] for item in skill_md_files]
-                })
-
-            skills_folder = any(
-                item["path"].startswith("skills/") or item["path"] == "skills"
-                for item in tree_data["tree"]
-            )
-
-            if skills_folder:
-                indicators.append({
-                    "type": "repo_skills_folder",
-                    "value": True,
-                    "skill_count": 5
-                })
+            paths = [item["path"] for item in tree_data["tree"]]
+            return (paths, not tree_data.get("truncated", False))
 
         except httpx.HTTPError as e:
             logger.debug(f"Could not fetch tree for {owner}/{name}: {e}")
         except Exception as e:
             logger.debug(f"Error parsing tree for {owner}/{name}: {e}")
 
+        return None
+
+    def _tree_indicators(self, paths: List[str]) -> list:
+        """Find skill indicators in a repository's file and directory paths."""
+        indicators = []
+
+        skill_md_files = [path for path in paths if path.endswith("SKILL.md")]
+
+        if skill_md_files:
+            indicators.append({
+                "type": "repo_skill_md_files",
+                "value": len(skill_md_files),
+                "skill_count": len(skill_md_files),
+                "paths": skill_md_files
+            })
+
+        skills_folder = any(
+            path.startswith("skills/") or path == "skills"
+            for path in paths
+        )
+
+        if skills_folder:
+            indicators.append({
+                "type": "repo_skills_folder",
+                "value": True,
+                "skill_count": 5
+            })
+
         return indicators
 
+    @staticmethod
+    def _build_bundle_query(depth: int) -> str:
+        """Build the GraphQL query for a README plus ``depth`` levels of tree."""
+        entries = "entries { path type }"
+        for _ in range(depth - 1):
+            entries = f"entries {{ path type object {{ ... on Tree {{ {entries} }} }} }}"
+
+        return (
+            "query($owner: String!, $name: String!) {"
+            " repository(owner: $owner, name: $name) {"
+            " defaultBranchRef { name }"
+            ' readme: object(expression: "HEAD:README.md") { ... on Blob { text } }'
+            f' tree: object(expression: "HEAD:") {{ ... on Tree {{ {entries} }} }}'
+            " } }"
+        )
+
+    def _fetch_repo_bundle(
+        self,
+        owner: str,
+        name: str
+    ) -> Optional[Tuple[Optional[str], Optional[List[str]]]]:
+        """
+        Fetch a repository's README and tree paths in one GraphQL request.
+
+        Returns:
+            ``(readme_text, tree_paths)``, or None if the request failed.
+            ``tree_paths`` is None when the repository is deeper than the
+            query reaches, so the caller can fall back to the recursive REST
+            tree and still see every SKILL.md.
+        """
+        try:
+            response = self.client.post(
+                self._GRAPHQL_URL,
+                json={"query": self._bundle_query, "variables": {"owner": owner, "name": name}},
+                headers={"Authorization": f"bearer {self._token}"}
+            )
+            response.raise_for_status()
+            repository = (response.json().get("data") or {}).get("repository")
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug(f"GraphQL bundle failed for {owner}/{name}: {e}")
+            return None
+
+        if not repository:
+            return None
+
+        if repository.get("defaultBranchRef"):
+            self._branch_cache[f"{owner}/{name}"] = repository["defaultBranchRef"]["name"]
+
+        readme_text = (repository.get("readme") or {}).get("text")
+
+        paths = []
+        pending = list((repository.get("tree") or {}).get("entries") or [])
+
+        while pending:
+            entry = pending.pop()
+            paths.append(entry["path"])
+
+            if entry["type"] != "tree":
+                continue
+            if "object" not in entry:
+                return readme_text, None
+            pending.extend((entry["object"] or {}).get("entries") or [])
+
+        return readme_text, sorted(paths)
+
     def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client unless it was passed in by the caller."""
+        if self._owns_client:
+            self.client.close()
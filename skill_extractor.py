@@ -1,11 +1,15 @@
 """Extractor for downloading and extracting skills from repositories."""
 
+import os
+import posixpath
+import re
 import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 import subprocess
-import re
 
 from loguru import logger
 from config import ExtractionConfig
@@ -14,6 +18,13 @@ from config import ExtractionConfig
 class SkillExtractor:
     """Extracts actual skills from skill repositories."""
 
+    _COPY_WORKERS = 8
+    _PARALLEL_COPY_MIN_FILES = 16
+    # Only directories that can't hold a real skill; names like "build" or
+    # "dist" are legitimate skill folders, so they are walked.
+    _SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv", "venv", ".tox"})
+    _EXTRACTED_RE = re.compile(rb"extracted-from:", re.IGNORECASE)
+
     def __init__(self, skills_dir: str = None, config: ExtractionConfig = None):
         self.config = config or ExtractionConfig()
 
@@ -26,7 +37,18 @@ class SkillExtractor:
         self.skills_dir = Path(skills_dir).expanduser()
         self.skills_dir.mkdir(parents=True, exist_ok=True)
 
-        self.staging_dir = Path(tempfile.mkdtemp(prefix="skill-scraper-staging-"))
+        # Clones go to the system temp dir unless staging_fs says otherwise.
+        # Staged skills default to a folder next to the skills dir, so that
+        # installing one is a rename on the same filesystem.
+        self.scratch_dir = self.config.staging_fs
+        self.staging_dir = Path(tempfile.mkdtemp(
+            prefix="skill-scraper-staging-",
+            dir=self.scratch_dir or self.skills_dir.parent
+        ))
+        # Skills from different repos can map to the same staging folder, so
+        # each folder gets its own lock; the guard only protects the dict.
+        self._staging_locks: Dict[str, threading.Lock] = {}
+        self._staging_locks_guard = threading.Lock()
 
         logger.info(f"SkillExtractor initialized with mode: {self.config.mode}")
         logger.info(f"Installation location: {self.config.install_location} ({self.skills_dir})")
@@ -57,10 +79,22 @@ class SkillExtractor:
             "skills": []
         }
 
-        temp_dir = Path(tempfile.mkdtemp(prefix=f"skill-scraper-{owner}-{name}-"))
+        if self._skill_paths(detection_result) == []:
+            logger.info(f"No SKILL.md files in {owner}/{name}, skipping clone")
+            return result
+
+        temp_dir = Path(tempfile.mkdtemp(prefix=f"skill-scraper-{owner}-{name}-", dir=self.scratch_dir))
 
         try:
-            if not self._clone_repo(url, temp_dir):
+            sparse_dirs = self._sparse_dirs(detection_result)
+            cloned = self._clone_repo(url, temp_dir, sparse_dirs)
+
+            if not cloned and sparse_dirs:
+                logger.warning(f"Sparse clone failed for {url}, retrying with a full clone")
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                cloned = self._clone_repo(url, temp_dir)
+
+            if not cloned:
                 logger.error(f"Failed to clone {url}")
                 return result
 
@@ -98,25 +132,169 @@ class SkillExtractor:
             logger.error(f"Error extracting skills from {owner}/{name}: {e}", exc_info=True)
 
         finally:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-                logger.debug(f"Cleaned up temp directory: {temp_dir}")
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            logger.debug(f"Cleaned up temp directory: {temp_dir}")
 
         return result
 
-    def _clone_repo(self, url: str, target_dir: Path) -> bool:
-        """Clone a repository to a temporary directory."""
+    def extract_skills_batch(
+        self,
+        repos: List[Dict[str, str]],
+        detection_results: Dict[str, Dict],
+        on_complete: Optional[Callable[[Dict[str, str], Dict[str, any]], None]] = None
+    ) -> Dict[str, Dict[str, any]]:
+        """
+        Extract skills from many repositories concurrently.
+
+        Clones are I/O-bound and each one works in its own temporary
+        directory, so up to ``config.jobs`` repositories are cloned and
+        extracted at once. A repository listed more than once (GitHub names
+        are case-insensitive) is only cloned once, under its first listing.
+
+        Args:
+            repos: Repositories to extract skills from
+            detection_results: Results from SkillDetector keyed by full name
+            on_complete: Optional callback invoked with each repo and its
+                extraction result once done
+
+        Returns:
+            Extraction results keyed by repository full name, in input order
+            and without duplicates
+        """
+        if not repos:
+            return {}
+
+        unique = {}
+        for repo in repos:
+            unique.setdefault(repo["full_name"].lower(), repo)
+
+        with ThreadPoolExecutor(max_workers=min(self.config.jobs, len(unique))) as executor:
+            futures = {
+                executor.submit(
+                    self.extract_skills, repo, detection_results.get(repo["full_name"], {})
+                ): key
+                for key, repo in unique.items()
+            }
+            results = {}
+
+            for future in as_completed(futures):
+                key = futures[future]
+                results[key] = future.result()
+                if on_complete:
+                    on_complete(unique[key], results[key])
+
+        return {repo["full_name"]: results[key] for key, repo in unique.items()}
+
+    def filter_new(
+        self,
+        repos: List[Dict[str, str]],
+        detection_results: Dict[str, Dict]
+    ) -> List[Dict[str, str]]:
+        """
+        Drop repositories whose detected skills are all installed already.
+
+        Skill names are predicted from the complete list of SKILL.md paths
+        found during detection (``skill_paths``), so these repositories are
+        never cloned. Repositories without that list, e.g. because the tree
+        listing was truncated or skills may live in submodules, or with a
+        SKILL.md at the root, are kept. Does nothing when existing skills
+        are being updated.
+        """
+        if not self.config.skip_existing or self.config.update_existing:
+            return repos
+
+        installed = {entry.name for entry in os.scandir(self.skills_dir) if entry.is_dir()}
+        new_repos = []
+
+        for repo in repos:
+            detection_result = detection_results.get(repo["full_name"], {})
+
+            if self._skill_paths(detection_result) is None:
+                new_repos.append(repo)
+                continue
+
+            sparse_dirs = self._sparse_dirs(detection_result)
+            names = {
+                self._determine_skill_name(Path(folder), tuple(folder.split("/")), repo)
+                for folder in sparse_dirs or ()
+            }
+
+            if names and names <= installed:
+                logger.info(f"All skills from {repo['full_name']} already installed, skipping")
+                continue
+
+            new_repos.append(repo)
+
+        return new_repos
+
+    def _skill_paths(self, detection_result: Dict) -> Optional[List[str]]:
+        """
+        Get the SKILL.md paths detection found, or None if they are unknown.
+
+        The detector lists only the host repository's tree, never submodule
+        contents, so with ``recurse_submodules`` the paths are treated as
+        unknown: no clone is skipped and the checkout is never sparse.
+        """
+        if self.config.recurse_submodules:
+            return None
+
+        return detection_result.get("skill_paths")
+
+    def _sparse_dirs(self, detection_result: Dict) -> Optional[List[str]]:
+        """
+        Get the skill directories to sparse-checkout from a detection result.
+
+        Only ``skill_paths`` is used: the detector sets it just for complete
+        tree listings, and a truncated listing could leave skills out of the
+        checkout. Returns None when the SKILL.md paths are unknown or one
+        sits at the repository root, since a root skill folder is the whole
+        repository.
+        """
+        paths = self._skill_paths(detection_result)
+
+        if paths is None:
+            return None
+
+        dirs = sorted({posixpath.dirname(path) for path in paths})
+
+        if not dirs or "" in dirs:
+            return None
+
+        return dirs
+
+    def _clone_repo(self, url: str, target_dir: Path, sparse_dirs: Optional[List[str]] = None) -> bool:
+        """
+        Clone a repository to a temporary directory.
+
+        With ``sparse_dirs`` the clone is a blobless partial clone that only
+        checks out those directories (plus top-level files), so large
+        repositories don't download content unrelated to their skills.
+        """
         try:
             logger.info(f"Cloning {url} to {target_dir}")
 
             cmd = [
                 "git", "clone",
                 "--depth", str(self.config.clone_depth),
-                "--quiet",
-                url,
-                str(target_dir)
+                "--single-branch",
+                "--no-tags",
+                "--quiet"
             ]
 
+            # A full checkout needs every blob anyway, so only sparse clones
+            # skip them up front.
+            if sparse_dirs:
+                cmd += ["--filter=blob:none", "--sparse"]
+
+            if self.config.recurse_submodules:
+                cmd += [
+                    "--recurse-submodules",
+                    "--shallow-submodules",
+                    f"--jobs={self.config.clone_jobs}"
+                ]
+
+            cmd += [url, str(target_dir)]
+
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -128,6 +306,18 @@ class SkillExtractor:
                 logger.error(f"Git clone failed: {result.stderr}")
                 return False
 
+            if sparse_dirs:
+                result = subprocess.run(
+                    ["git", "-C", str(target_dir), "sparse-checkout", "set", "--", *sparse_dirs],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
+
+                if result.returncode != 0:
+                    logger.error(f"Git sparse-checkout failed: {result.stderr}")
+                    return False
+
             logger.info(f"Successfully cloned {url}")
             return True
 
@@ -139,13 +329,29 @@ class SkillExtractor:
             return False
 
     def _find_skill_files(self, repo_dir: Path) -> List[Path]:
-        """Find all SKILL.md files in a repository."""
-        skill_files = list(repo_dir.rglob("SKILL.md"))
+        """
+        Find all SKILL.md files in a repository.
+
+        VCS metadata, dependency, cache and virtualenv directories are pruned
+        during the walk rather than filtered afterwards, so they are never
+        scanned, and directory entries are classified from ``os.scandir``
+        without a separate stat per entry.
+        The result is sorted so extraction order doesn't depend on the
+        filesystem.
+        """
+        skill_files = []
+        stack = [str(repo_dir)]
 
-        skill_files = [
-            f for f in skill_files
-            if ".git" not in f.parts
-        ]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self._SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name == "SKILL.md":
+                        skill_files.append(Path(entry.path))
+
+        skill_files.sort()
 
         logger.info(f"Found {len(skill_files)} SKILL.md files")
         return skill_files
@@ -166,9 +372,10 @@ class SkillExtractor:
 
         try:
             skill_folder = skill_file.parent
-            relative_path = skill_folder.relative_to(repo_dir)
+            relative = os.path.relpath(skill_folder, repo_dir)
+            relative_parts = () if relative == os.curdir else tuple(relative.split(os.sep))
 
-            skill_name = self._determine_skill_name(skill_folder, relative_path, source_repo)
+            skill_name = self._determine_skill_name(skill_folder, relative_parts, source_repo)
 
             final_target_folder = self.skills_dir / skill_name
 
@@ -181,19 +388,21 @@ class SkillExtractor:
                     logger.info(f"Skill already exists, will update: {skill_name}")
 
             staging_folder = self.staging_dir / skill_name
-            staging_folder.mkdir(parents=True, exist_ok=True)
+            skill_md_path = staging_folder / "SKILL.md"
 
-            self._copy_skill_files(skill_folder, staging_folder)
+            with self._staging_lock(skill_name):
+                staging_folder.mkdir(parents=True, exist_ok=True)
 
-            skill_md_path = staging_folder / "SKILL.md"
-            self._enrich_skill_metadata(
-                skill_md_path,
-                source_repo,
-                skill_name,
-                detection_result
-            )
+                self._copy_skill_files(skill_folder, staging_folder)
+
+                content = self._enrich_skill_metadata(
+                    skill_md_path,
+                    source_repo,
+                    skill_name,
+                    detection_result
+                )
 
-            metadata = self._parse_skill_metadata(skill_md_path)
+            metadata = self._parse_skill_metadata(skill_md_path, content=content)
 
             logger.info(f"Extracted skill to staging: {skill_name}")
 
@@ -213,39 +422,68 @@ class SkillExtractor:
 
         return result
 
+    def _staging_lock(self, skill_name: str) -> threading.Lock:
+        """Get the lock serializing writes to one staging folder."""
+        with self._staging_locks_guard:
+            return self._staging_locks.setdefault(skill_name, threading.Lock())
+
     def _determine_skill_name(
         self,
         skill_folder: Path,
-        relative_path: Path,
+        relative_parts: Tuple[str, ...],
         source_repo: Dict[str, str]
     ) -> str:
-        """Determine the name for an extracted skill."""
+        """
+        Determine the name for an extracted skill.
+
+        Args:
+            skill_folder: Folder containing the SKILL.md
+            relative_parts: Path components of the folder relative to the repo root
+            source_repo: Repository the skill comes from
+        """
         folder_name = skill_folder.name
+        owner = source_repo["owner"]
+        repo_name = source_repo["name"]
 
-        if folder_name == "." or folder_name == source_repo["name"]:
-            return f"{source_repo['owner']}-{source_repo['name']}"
+        if folder_name in (".", repo_name):
+            return f"{owner}-{repo_name}"
 
-        if relative_path.parts and relative_path.parts[0] == "skills":
-            if len(relative_path.parts) > 1:
-                return f"{source_repo['owner']}-{relative_path.parts[1]}"
+        if relative_parts[:1] == ("skills",) and len(relative_parts) > 1:
+            return f"{owner}-{relative_parts[1]}"
 
-        return f"{source_repo['owner']}-{folder_name}"
+        return f"{owner}-{folder_name}"
 
     def _copy_skill_files(self, source_folder: Path, target_folder: Path):
-        """Copy skill files from source to target."""
-        for item in source_folder.iterdir():
-            if item.name.startswith('.'):
-                continue
+        """
+        Copy skill files from source to target.
 
-            if item.name == '__pycache__':
+        Directories are created up front, then the files are copied; once
+        there are more than ``_PARALLEL_COPY_MIN_FILES`` of them (e.g. a
+        skill with a large references folder) the copies run in parallel.
+        """
+        files = []
+
+        for item in source_folder.iterdir():
+            if item.name.startswith('.') or item.name == '__pycache__':
                 continue
 
             if item.is_file():
-                shutil.copy2(item, target_folder / item.name)
-                logger.debug(f"Copied file: {item.name}")
+                files.append((item, target_folder / item.name))
             elif item.is_dir():
-                shutil.copytree(item, target_folder / item.name, dirs_exist_ok=True)
-                logger.debug(f"Copied directory: {item.name}")
+                for root, _, names in os.walk(item, followlinks=True):
+                    target_root = target_folder / os.path.relpath(root, source_folder)
+                    target_root.mkdir(parents=True, exist_ok=True)
+                    files.extend((os.path.join(root, name), target_root / name) for name in names)
+
+        if len(files) <= self._PARALLEL_COPY_MIN_FILES:
+            for source, target in files:
+                shutil.copy2(source, target)
+        else:
+            with ThreadPoolExecutor(max_workers=self._COPY_WORKERS) as executor:
+                for future in [executor.submit(shutil.copy2, *pair) for pair in files]:
+                    future.result()
+
+        logger.debug("Copied {} files to {}", len(files), target_folder)
 
     def _enrich_skill_metadata(
         self,
@@ -253,15 +491,20 @@ class SkillExtractor:
         source_repo: Dict[str, str],
         skill_name: str,
         detection_result: Dict
-    ):
-        """Add metadata to extracted skill."""
+    ) -> Optional[str]:
+        """
+        Add metadata to extracted skill.
+
+        Returns:
+            The final SKILL.md content, or None if it could not be read
+        """
         if not skill_file.exists():
-            return
+            return None
 
         try:
-            content = skill_file.read_text()
+            data = skill_file.read_bytes()
 
-            if "extracted-from:" not in content.lower():
+            if not self._EXTRACTED_RE.search(data):
                 metadata_footer = f"""
 
 ---
@@ -269,41 +512,50 @@ class SkillExtractor:
 **Detection confidence**: {detection_result.get('confidence', 0):.0%}
 **Installed as**: {skill_name}
 """
-                content += metadata_footer
-                skill_file.write_text(content)
+                footer = metadata_footer.encode()
+                with open(skill_file, "ab") as f:
+                    f.write(footer)
+                data += footer
                 logger.debug(f"Enriched metadata for {skill_name}")
 
+            return data.decode()
+
         except Exception as e:
             logger.warning(f"Could not enrich metadata for {skill_name}: {e}")
+            return None
+
+    def _parse_skill_metadata(self, skill_file: Path, content: Optional[str] = None) -> Dict[str, str]:
+        """
+        Parse metadata from SKILL.md file.
 
-    def _parse_skill_metadata(self, skill_file: Path) -> Dict[str, str]:
-        """Parse metadata from SKILL.md file."""
+        Args:
+            skill_file: Path to the SKILL.md file
+            content: The file's content if already in memory, to skip reading it
+        """
         metadata = {
             "name": "",
             "description": "No description available",
             "content": ""
         }
 
-        if not skill_file.exists():
+        if content is None and not skill_file.exists():
             return metadata
 
         try:
-            content = skill_file.read_text()
+            if content is None:
+                content = skill_file.read_text()
             metadata["content"] = content
 
-            frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            if frontmatter_match:
-                frontmatter = frontmatter_match.group(1)
-                for line in frontmatter.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        key = key.strip().lower()
-                        value = value.strip()
-                        if key in ['name', 'description']:
-                            metadata[key] = value
+            lines = content.split('\n')
+
+            for line in self._frontmatter_lines(lines):
+                key, sep, value = line.partition(':')
+                if sep:
+                    key = key.strip().lower()
+                    if key in ['name', 'description']:
+                        metadata[key] = value.strip()
 
             if not metadata["description"] or metadata["description"] == "No description available":
-                lines = content.split('\n')
                 for i, line in enumerate(lines):
                     if line.startswith('# ') and i + 1 < len(lines):
                         next_line = lines[i + 1].strip()
@@ -316,6 +568,30 @@ class SkillExtractor:
 
         return metadata
 
+    @staticmethod
+    def _frontmatter_lines(lines: List[str]) -> List[str]:
+        """
+        Return the lines between a leading ``---`` and the next ``---`` line.
+
+        The closing delimiter must be followed by a newline. Returns an empty
+        list when the file has no complete frontmatter block, without looking
+        past the first line if it doesn't open one.
+        """
+        if not lines or lines[0].rstrip() != '---':
+            return []
+
+        # Blank lines after the opening delimiter belong to it, so the block
+        # starts at the first non-blank line and can't close on that line.
+        start = 1
+        while start < len(lines) and not lines[start].strip():
+            start += 1
+
+        for i in range(start + 1, len(lines) - 1):
+            if lines[i].rstrip() == '---':
+                return lines[start:i]
+
+        return []
+
     def install_skills(self, skills_to_install: List[Dict[str, str]]) -> Dict[str, any]:
         """
         Install selected skills from staging to final location.
@@ -349,7 +625,9 @@ class SkillExtractor:
                     shutil.rmtree(final_path)
                     logger.debug(f"Removed existing skill at {final_path}")
 
-                shutil.copytree(staging_path, final_path)
+                # A rename when staging and skills dir share a filesystem;
+                # shutil.move only falls back to copying across devices.
+                shutil.move(staging_path, final_path)
                 logger.info(f"Installed skill: {skill['name']} to {final_path}")
                 result["success"] += 1
 
@@ -1,20 +1,57 @@
 """Claude skill generator for GitHub repositories."""
 
+import os
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Set
 
 from loguru import logger
 
 
+@lru_cache(maxsize=1024)
+def _skill_folder(skills_dir: Path, owner: str, name: str) -> Path:
+    """Resolve a repository's skill folder, reusing Paths across calls."""
+    return skills_dir / f"{owner}-{name}"
+
+
 class SkillGenerator:
     """Generates Claude skills from GitHub repositories."""
 
+    _SKILL_TEMPLATE = """---
+name: {full_name}
+description: {description}
+---
+
+# {full_name}
+
+GitHub Repository: {url}
+
+## Description
+
+{description}
+
+## Usage
+
+This skill provides context about the {name} repository by {owner}.
+
+Visit the repository for more information: {url}
+"""
+
     def __init__(self, skills_dir: str = "~/.claude/skills"):
         self.skills_dir = Path(skills_dir).expanduser()
         self.skills_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Skills directory: {self.skills_dir}")
 
+    def _scan_installed(self) -> Set[str]:
+        """Collect the names of skill folders in the skills directory."""
+        try:
+            with os.scandir(self.skills_dir) as entries:
+                # is_dir() is answered from the directory entry, not a stat().
+                return {entry.name for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            return set()
+
     def generate_skill(self, repo: Dict[str, str], update: bool = False) -> bool:
         """
         Generate a SKILL.md file for a repository.
@@ -26,58 +63,118 @@ class SkillGenerator:
         Returns:
             True if successful, False otherwise
         """
-        skill_name = f"{repo['owner']}-{repo['name']}"
-        skill_folder = self.skills_dir / skill_name
+        return self.generate_skills([repo], update=update)[0]
+
+    def generate_skills(
+        self,
+        repos: List[Dict[str, str]],
+        update: bool = False,
+        on_complete: Optional[Callable[[Dict[str, str], bool], None]] = None
+    ) -> List[bool]:
+        """
+        Generate SKILL.md files for many repositories.
 
-        if skill_folder.exists() and not update:
+        Skill folders are all created in one sorted pass before any SKILL.md
+        is written, rather than interleaving directory and file creation per
+        repository. Whether a skill already existed is decided by that
+        mkdir, so folders added or removed by other processes are noticed.
+
+        Args:
+            repos: Repository dictionaries with owner, name, description, url
+            update: If True, update existing skills instead of skipping
+            on_complete: Optional callback invoked with each repo and its result
+
+        Returns:
+            Success flag for each repository, in input order
+        """
+        folders = [_skill_folder(self.skills_dir, repo['owner'], repo['name']) for repo in repos]
+        created: Set[str] = set()
+
+        for folder in sorted(set(folders)):
+            try:
+                # skills_dir was created up front, so only the leaf is needed.
+                folder.mkdir()
+                created.add(folder.name)
+            except FileExistsError:
+                pass
+            except OSError as e:
+                logger.error(f"Failed to create skill folder {folder}: {e}")
+
+        results = []
+        for repo, folder in zip(repos, folders):
+            success = self._write_skill(repo, folder, update, created)
+            results.append(success)
+            if on_complete:
+                on_complete(repo, success)
+
+        return results
+
+    def _write_skill(
+        self,
+        repo: Dict[str, str],
+        skill_folder: Path,
+        update: bool,
+        created: Set[str]
+    ) -> bool:
+        """Write one repository's SKILL.md; ``created`` holds folders made for this batch."""
+        skill_name = skill_folder.name
+
+        # A folder made for this batch counts as existing once it's written.
+        existed = skill_name not in created
+
+        if existed and not update:
             logger.warning(f"Skill {skill_name} already exists, skipping")
             return False
 
-        skill_folder.mkdir(parents=True, exist_ok=True)
         skill_file = skill_folder / "SKILL.md"
 
         skill_content = self._create_skill_content(repo)
 
-        try:
-            with open(skill_file, 'w') as f:
-                f.write(skill_content)
+        # Written beside the target and renamed over it, so an existing
+        # SKILL.md is never left half-written.
+        tmp_file = skill_folder / "SKILL.md.tmp"
 
-            action = "Updated" if skill_folder.exists() else "Created"
+        try:
+            data = memoryview(skill_content.encode())
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+
+            os.replace(tmp_file, skill_file)
+
+            created.discard(skill_name)
+            action = "Updated" if existed else "Created"
             logger.info(f"{action} skill: {skill_name} at {skill_file}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to create skill {skill_name}: {e}")
-            if skill_folder.exists() and not update:
-                shutil.rmtree(skill_folder)
+            tmp_file.unlink(missing_ok=True)
+            if skill_name in created:
+                created.discard(skill_name)
+                try:
+                    skill_folder.rmdir()
+                except OSError:
+                    pass
             return False
 
     def _create_skill_content(self, repo: Dict[str, str]) -> str:
         """Create SKILL.md content for a repository."""
-        skill_name = f"{repo['owner']}/{repo['name']}"
-        description = repo.get('description', 'No description available')
-
-        content = f"""---
-name: {skill_name}
-description: {description}
----
-
-# {skill_name}
-
-GitHub Repository: {repo['url']}
-
-## Description
-
-{description}
-
-## Usage
-
-This skill provides context about the {repo['name']} repository by {repo['owner']}.
-
-Visit the repository for more information: {repo['url']}
-"""
-
-        return content
+        owner = repo['owner']
+        name = repo['name']
+
+        # format_map fills the fields in C; values are inserted verbatim, so
+        # braces in descriptions are safe.
+        return self._SKILL_TEMPLATE.format_map({
+            'full_name': f"{owner}/{name}",
+            'description': repo.get('description', 'No description available'),
+            'url': repo['url'],
+            'name': name,
+            'owner': owner,
+        })
 
     def remove_skill(self, repo: Dict[str, str]) -> bool:
         """
@@ -89,27 +186,30 @@ Visit the repository for more information: {repo['url']}
         Returns:
             True if successful, False otherwise
         """
-        skill_name = f"{repo['owner']}-{repo['name']}"
-        skill_folder = self.skills_dir / skill_name
-
-        if not skill_folder.exists():
-            logger.warning(f"Skill {skill_name} does not exist")
-            return False
+        skill_folder = _skill_folder(self.skills_dir, repo['owner'], repo['name'])
+        skill_name = skill_folder.name
 
         try:
-            shutil.rmtree(skill_folder)
+            try:
+                # Generated skills hold only SKILL.md, which this removes
+                # without rmtree's scan; anything else falls back to it.
+                os.unlink(skill_folder / "SKILL.md")
+                os.rmdir(skill_folder)
+            except OSError:
+                shutil.rmtree(skill_folder)
             logger.info(f"Removed skill: {skill_name}")
             return True
 
+        except FileNotFoundError:
+            logger.warning(f"Skill {skill_name} does not exist")
+            return False
+
         except Exception as e:
             logger.error(f"Failed to remove skill {skill_name}: {e}")
             return False
 
     def list_installed_skills(self) -> list:
         """List all installed skills."""
-        if not self.skills_dir.exists():
-            return []
-
-        skills = [d.name for d in self.skills_dir.iterdir() if d.is_dir()]
+        skills = sorted(self._scan_installed())
         logger.info(f"Found {len(skills)} installed skills")
         return skills
@@ -1,12 +1,55 @@
 """Storage module for repository data."""
 
 import json
+import os
+import sqlite3
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Parsed storage files keyed by resolved path, tagged with the
+# (mtime_ns, size) they were read at so external edits invalidate them.
+_load_cache: Dict[Path, Tuple[Tuple[int, int], List[Dict[str, str]]]] = {}
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to indented JSON, using orjson or ujson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if ujson is not None:
+        return ujson.dumps(obj, indent=2, ensure_ascii=False, escape_forward_slashes=False).encode()
+    return json.dumps(obj, indent=2).encode()
+
+
+def _dumps_compact(obj) -> bytes:
+    """Serialize to single-line JSON, using orjson or ujson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson or ujson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
 
 class RepoStorage:
     """Handles storage and retrieval of repository data."""
@@ -23,13 +66,7 @@ class RepoStorage:
             merge: If True, merge with existing repos instead of overwriting
             source: Optional source identifier (e.g., awesome list URL)
         """
-        timestamp = datetime.now().isoformat()
-
-        for repo in repos:
-            if 'scraped_at' not in repo:
-                repo['scraped_at'] = timestamp
-            if source and 'source' not in repo:
-                repo['source'] = source
+        self._stamp(repos, source)
 
         if merge and self.exists():
             existing_repos = self.load_repos()
@@ -40,11 +77,23 @@ class RepoStorage:
             repos_to_save = repos
             logger.info(f"Saving {len(repos)} repositories to {self.storage_path}")
 
-        with open(self.storage_path, 'w') as f:
-            json.dump(repos_to_save, f, indent=2)
+        _load_cache.pop(self.storage_path.resolve(), None)
+
+        self.storage_path.write_bytes(_dumps(repos_to_save))
 
         logger.info(f"Successfully saved {len(repos_to_save)} repositories to {self.storage_path}")
 
+    @staticmethod
+    def _stamp(repos: List[Dict[str, str]], source: Optional[str]) -> None:
+        """Record when and, if known, where each repository was scraped."""
+        timestamp = datetime.now().isoformat()
+
+        for repo in repos:
+            if 'scraped_at' not in repo:
+                repo['scraped_at'] = timestamp
+            if source and 'source' not in repo:
+                repo['source'] = source
+
     def load_repos(self) -> List[Dict[str, str]]:
         """
         Load repositories from JSON file.
@@ -52,17 +101,45 @@ class RepoStorage:
         Returns:
             List of repository dictionaries
         """
-        if not self.storage_path.exists():
+        path = self.storage_path.resolve()
+
+        # One stat both checks for the file and keys the parse cache.
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             logger.warning(f"Storage file {self.storage_path} does not exist")
             return []
 
         logger.info(f"Loading repositories from {self.storage_path}")
 
-        with open(self.storage_path, 'r') as f:
-            repos = json.load(f)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        cached = _load_cache.get(path)
+
+        if cached is not None and cached[0] == stat_key:
+            repos = cached[1]
+        else:
+            repos = self._parse(path.read_bytes())
+            _load_cache[path] = (stat_key, repos)
 
         logger.info(f"Loaded {len(repos)} repositories")
-        return repos
+        return [dict(repo) for repo in repos]
+
+    @staticmethod
+    def _parse(data: bytes) -> List[Dict[str, str]]:
+        """
+        Parse a JSON array file, or a JSON lines file such as one written by
+        JsonlRepoStorage, where the latest record for each full_name wins.
+        """
+        if not data.lstrip().startswith(b'{'):
+            return _loads(data)
+
+        latest: Dict[str, Dict[str, str]] = {}
+        for line in data.splitlines():
+            if line.strip():
+                repo = _loads(line)
+                latest[repo['full_name']] = repo
+
+        return list(latest.values())
 
     def exists(self) -> bool:
         """Check if storage file exists."""
@@ -94,14 +171,261 @@ class RepoStorage:
             full_name = new_repo['full_name']
 
             if full_name in repo_map:
-                repo_map[full_name].update(new_repo)
+                repo_map[full_name] |= new_repo
                 updated_count += 1
-                logger.debug(f"Updated existing repo: {full_name}")
+                logger.debug("Updated existing repo: {}", full_name)
             else:
                 repo_map[full_name] = new_repo
                 added_count += 1
-                logger.debug(f"Added new repo: {full_name}")
+                logger.debug("Added new repo: {}", full_name)
 
         logger.info(f"Merge complete: {added_count} added, {updated_count} updated, {len(repo_map)} total")
 
         return list(repo_map.values())
+
+
+class SqliteRepoStorage(RepoStorage):
+    """
+    Stores repository data in SQLite, keyed by full_name.
+
+    A merge is an upsert of just the incoming repositories, so saving new
+    data never rewrites the whole file, and ``source``/``scraped_at`` are
+    indexed columns for querying.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS repos (
+            full_name TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            scraped_at TEXT,
+            source TEXT
+        );
+        CREATE INDEX IF NOT EXISTS repos_source ON repos (source);
+        CREATE INDEX IF NOT EXISTS repos_scraped_at ON repos (scraped_at);
+    """
+
+    # ``data`` arrives already merged in Python (json_patch would drop keys
+    # whose incoming value is null); updating keeps the row's rowid, and
+    # with it the insertion order.
+    _UPSERT = """
+        INSERT INTO repos (full_name, data, scraped_at, source)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (full_name) DO UPDATE SET
+            data = excluded.data,
+            scraped_at = excluded.scraped_at,
+            source = coalesce(excluded.source, repos.source)
+    """
+
+    def __init__(self, storage_file: str = "repos.db"):
+        super().__init__(storage_file)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema if needed."""
+        conn = sqlite3.connect(self.storage_path)
+        conn.executescript(self._SCHEMA)
+        return conn
+
+    def save_repos(self, repos: List[Dict[str, str]], merge: bool = False, source: Optional[str] = None) -> None:
+        """
+        Save repositories to the database.
+
+        Args:
+            repos: List of repository dictionaries
+            merge: If True, upsert into existing repos instead of replacing them
+            source: Optional source identifier (e.g., awesome list URL)
+        """
+        self._stamp(repos, source)
+
+        conn = self._connect()
+        try:
+            with conn:
+                if merge:
+                    merged = self._stored(conn, repos)
+                    for repo in repos:
+                        merged[repo['full_name']] = merged.get(repo['full_name'], {}) | repo
+                    repos = list(merged.values())
+                else:
+                    conn.execute("DELETE FROM repos")
+
+                conn.executemany(self._UPSERT, [
+                    (repo['full_name'], json.dumps(repo), repo.get('scraped_at'), repo.get('source'))
+                    for repo in repos
+                ])
+                total = conn.execute("SELECT count(*) FROM repos").fetchone()[0]
+        finally:
+            conn.close()
+
+        action = "Merged" if merge else "Saved"
+        logger.info(f"{action} {len(repos)} repositories, {total} total in {self.storage_path}")
+
+    @staticmethod
+    def _stored(conn: sqlite3.Connection, repos: List[Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+        """Load the stored records of the given repositories, keyed by full_name."""
+        names = json.dumps([repo['full_name'] for repo in repos])
+        rows = conn.execute(
+            "SELECT full_name, data FROM repos WHERE full_name IN (SELECT value FROM json_each(?))",
+            (names,)
+        )
+        return {full_name: _loads(data) for full_name, data in rows}
+
+    def load_repos(self) -> List[Dict[str, str]]:
+        """
+        Load repositories from the database, in insertion order.
+
+        Returns:
+            List of repository dictionaries
+        """
+        if not self.storage_path.exists():
+            logger.warning(f"Storage file {self.storage_path} does not exist")
+            return []
+
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT data FROM repos ORDER BY rowid").fetchall()
+        finally:
+            conn.close()
+
+        repos = [_loads(data) for data, in rows]
+        logger.info(f"Loaded {len(repos)} repositories from {self.storage_path}")
+        return repos
+
+
+class JsonlRepoStorage(RepoStorage):
+    """
+    Stores repository data as append-only JSON lines.
+
+    A sidecar index maps each full_name to the offset of its latest record,
+    so a merge only appends the incoming repositories. Superseded records
+    are dropped once they outnumber the live ones.
+    """
+
+    def __init__(self, storage_file: str = "repos.jsonl"):
+        super().__init__(storage_file)
+        self.index_path = self.storage_path.with_suffix(".idx")
+
+    def _read_index(self) -> Tuple[Dict[str, int], int]:
+        """
+        Load the full_name -> offset index and the total record count.
+
+        The index is rebuilt by scanning the data file when it is missing or
+        was written for a different file size.
+        """
+        size = self.storage_path.stat().st_size
+
+        if self.index_path.exists():
+            index = _loads(self.index_path.read_bytes())
+            if index.get("size") == size:
+                return index["offsets"], index["records"]
+
+        offsets: Dict[str, int] = {}
+        records = 0
+        offset = 0
+
+        with open(self.storage_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    offsets[_loads(line)['full_name']] = offset
+                    records += 1
+                offset += len(line)
+
+        return offsets, records
+
+    def _write(self, repos_by_name: Dict[str, Dict[str, str]], append: bool,
+               offsets: Dict[str, int], records: int) -> int:
+        """Write records and persist the updated index; returns the record count."""
+        with open(self.storage_path, 'ab' if append else 'wb') as f:
+            offset = f.tell()
+            for full_name, repo in repos_by_name.items():
+                line = _dumps_compact(repo) + b"\n"
+                f.write(line)
+                offsets[full_name] = offset
+                offset += len(line)
+                records += 1
+
+        self.index_path.write_bytes(_dumps_compact({
+            "size": offset,
+            "records": records,
+            "offsets": offsets,
+        }))
+        return records
+
+    def save_repos(self, repos: List[Dict[str, str]], merge: bool = False, source: Optional[str] = None) -> None:
+        """
+        Save repositories to the JSON lines file.
+
+        Args:
+            repos: List of repository dictionaries
+            merge: If True, append to existing repos instead of overwriting
+            source: Optional source identifier (e.g., awesome list URL)
+        """
+        self._stamp(repos, source)
+
+        if not (merge and self.exists()):
+            self._write({repo['full_name']: repo for repo in repos}, False, {}, 0)
+            logger.info(f"Saved {len(repos)} repositories to {self.storage_path}")
+            return
+
+        offsets, records = self._read_index()
+        existing = self._read_records({
+            repo['full_name']: offsets[repo['full_name']]
+            for repo in repos if repo['full_name'] in offsets
+        })
+
+        incoming: Dict[str, Dict[str, str]] = {}
+        for repo in repos:
+            merged = incoming.get(repo['full_name']) or existing.get(repo['full_name'], {})
+            incoming[repo['full_name']] = {**merged, **repo}
+
+        records = self._write(incoming, True, offsets, records)
+
+        live = len(offsets)
+        logger.info(f"Appended {len(incoming)} repositories, {live} total in {self.storage_path}")
+
+        if records > 2 * live:
+            self._write({repo['full_name']: repo for repo in self.load_repos()}, False, {}, 0)
+            logger.debug(f"Compacted {self.storage_path}")
+
+    def _read_records(self, offsets: Dict[str, int]) -> Dict[str, Dict[str, str]]:
+        """Read the records at the given offsets, keyed like ``offsets``."""
+        if not offsets:
+            return {}
+
+        data = self.storage_path.read_bytes()
+        return {
+            full_name: _loads(data[offset:data.index(b"\n", offset)])
+            for full_name, offset in offsets.items()
+        }
+
+    def load_repos(self) -> List[Dict[str, str]]:
+        """
+        Load the latest record of each repository, in first-saved order.
+
+        Returns:
+            List of repository dictionaries
+        """
+        if not self.storage_path.exists():
+            logger.warning(f"Storage file {self.storage_path} does not exist")
+            return []
+
+        offsets, _ = self._read_index()
+        repos = list(self._read_records(offsets).values())
+
+        logger.info(f"Loaded {len(repos)} repositories from {self.storage_path}")
+        return repos
+
+
+_BACKENDS = {".jsonl": JsonlRepoStorage, ".db": SqliteRepoStorage, ".sqlite": SqliteRepoStorage}
+
+
+def open_storage(storage_file: Optional[str] = None) -> RepoStorage:
+    """
+    Open repository storage, picking the backend from the file extension.
+
+    Args:
+        storage_file: Storage file path; defaults to the SKILL_SCRAPER_STORAGE
+            environment variable, else ``repos.json``. ``.jsonl`` files use
+            JsonlRepoStorage, ``.db``/``.sqlite`` files SqliteRepoStorage and
+            anything else RepoStorage.
+    """
+    storage_file = storage_file or os.environ.get("SKILL_SCRAPER_STORAGE") or "repos.json"
+    return _BACKENDS.get(Path(storage_file).suffix.lower(), RepoStorage)(storage_file)
@@ -0,0 +1,40 @@
+"""Shared pytest fixtures and hooks."""
+
+import re
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the --runslow flag."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="also run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow; pass --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def skills_root(tmp_path_factory):
+    """Parent directory for every test's skills dir, created once per session."""
+    return tmp_path_factory.mktemp("skills_root")
+
+
+@pytest.fixture
+def skills_dir(skills_root, request):
+    """A per-test skills dir path; left for the code under test to create.
+
+    Named after the full node id, so same-named tests in different modules
+    or classes never share a directory.
+    """
+    return skills_root / re.sub(r"[^\w.-]+", "_", request.node.nodeid)
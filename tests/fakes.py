@@ -0,0 +1,198 @@
+"""Lightweight stand-ins for the collaborators main() constructs."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import ExtractionConfig
+
+
+class FakeProgress:
+    """Progress bar that accepts and ignores updates."""
+
+    def add_task(self, description, total=None):
+        return 0
+
+    def update(self, task, **kwargs):
+        pass
+
+    def advance(self, task):
+        pass
+
+
+class FakeUI:
+    """Scripted RepoSelector; records the name of every prompt it answers."""
+
+    def __init__(
+        self,
+        action: str = "exit",
+        url: str = "",
+        fetch_details: bool = False,
+        config: Optional[ExtractionConfig] = None,
+        selected: Optional[List[Dict[str, str]]] = None,
+        error: Optional[BaseException] = None
+    ):
+        self.action = action
+        self.url = url
+        self.fetch_details = fetch_details
+        self.config = config or ExtractionConfig.metadata_only()
+        self.selected = selected or []
+        self.error = error
+        self.calls: List[str] = []
+        self.summary = None
+
+    def select_action(self):
+        self.calls.append("select_action")
+        if self.error:
+            raise self.error
+        return self.action
+
+    def get_github_url(self):
+        self.calls.append("get_github_url")
+        return self.url
+
+    def confirm_action(self, message):
+        self.calls.append("confirm_action")
+        return self.fetch_details
+
+    def confirm_repo_merge(self, existing_count):
+        self.calls.append("confirm_repo_merge")
+        return False
+
+    def select_extraction_mode(self):
+        self.calls.append("select_extraction_mode")
+        return self.config
+
+    def confirm_skill_update(self):
+        self.calls.append("confirm_skill_update")
+        return False
+
+    def select_repos(self, repos, detection_results=None):
+        self.calls.append("select_repos")
+        return self.selected
+
+    def confirm_skill_extraction(self, repo, detection_result):
+        self.calls.append("confirm_skill_extraction")
+        return True
+
+    def review_extracted_skills(self, skills):
+        self.calls.append("review_extracted_skills")
+        return skills
+
+    def print_status(self, message, style=""):
+        pass
+
+    @contextmanager
+    def show_progress(self, description):
+        yield FakeProgress()
+
+    def show_summary(self, total, successful, failed, extracted=0, extraction_mode="metadata"):
+        self.calls.append("show_summary")
+        self.summary = {
+            "total": total,
+            "successful": successful,
+            "failed": failed,
+            "extracted": extracted,
+            "extraction_mode": extraction_mode,
+        }
+
+
+class FakeScraper:
+    """RepoScraper returning canned repositories."""
+
+    def __init__(self, repos: Optional[List[Dict[str, str]]] = None):
+        self.repos = repos or []
+        self.scraped: List[str] = []
+        self.fetched: List[List[Dict[str, str]]] = []
+        self.closed = 0
+
+    def scrape_awesome_repo(self, github_url):
+        self.scraped.append(github_url)
+        return self.repos
+
+    def fetch_repo_details_batch(self, repos, token=None, on_complete=None):
+        self.fetched.append(repos)
+        for repo in repos:
+            if on_complete:
+                on_complete(repo)
+        return repos
+
+    def close(self):
+        self.closed += 1
+
+
+class FakeStorage:
+    """In-memory RepoStorage."""
+
+    def __init__(self, repos: Optional[List[Dict[str, str]]] = None):
+        self.repos = repos
+        self.saved: List[List[Dict[str, str]]] = []
+        self.loads = 0
+
+    def exists(self):
+        return self.repos is not None
+
+    def load_repos(self):
+        self.loads += 1
+        return list(self.repos or [])
+
+    def save_repos(self, repos, merge=False, source=None):
+        self.saved.append(repos)
+
+
+class FakeSkillGen:
+    """SkillGenerator that reports scripted results without touching disk."""
+
+    # Same location SkillGenerator defaults to, built once for every fake.
+    skills_dir = Path("~/.claude/skills").expanduser()
+
+    def __init__(self, results: Optional[List[bool]] = None):
+        self.results = list(results) if results is not None else None
+        self.generated: List[Dict[str, str]] = []
+
+    def generate_skill(self, repo, update=False):
+        self.generated.append(repo)
+        return self.results.pop(0) if self.results else True
+
+    def generate_skills(self, repos, update=False, on_complete=None):
+        results = []
+        for repo in repos:
+            results.append(self.generate_skill(repo, update=update))
+            if on_complete:
+                on_complete(repo, results[-1])
+        return results
+
+
+class FakeDetector:
+    """SkillDetector that finds no skill repositories."""
+
+    def __init__(self):
+        self.closed = 0
+
+    def detect_many(self, repos, max_workers=None, on_complete=None):
+        return {repo["full_name"]: {"is_skill_repo": False, "indicators": []} for repo in repos}
+
+    def close(self):
+        self.closed += 1
+
+
+class FakeExtractor:
+    """SkillExtractor with nothing to extract."""
+
+    def __init__(self):
+        self.cleaned = 0
+
+    def filter_new(self, repos, detection_results):
+        return repos
+
+    def extract_skills_batch(self, repos, detection_results, on_complete=None):
+        return {}
+
+    def get_staged_skills(self):
+        return []
+
+    def install_skills(self, skills):
+        return {"success": 0, "failed": 0, "errors": []}
+
+    def cleanup_staging(self):
+        self.cleaned += 1
@@ -1,5 +1,7 @@
 """Tests for config module."""
 
+import dataclasses
+
 import pytest
 from config import ExtractionConfig
 
@@ -79,3 +81,17 @@ class TestExtractionConfig:
 
         assert config_no_review.show_skill_review is False
         assert config_with_review.show_skill_review is True
+
+    def test_presets_are_shared_and_immutable(self):
+        """Test that preset factories return one frozen instance."""
+        config = ExtractionConfig.metadata_only()
+
+        assert ExtractionConfig.metadata_only() is config
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.update_existing = True
+
+        updated = dataclasses.replace(config, update_existing=True)
+
+        assert updated.update_existing is True
+        assert config.update_existing is False
@@ -0,0 +1,28 @@
+"""Tests for http_client module."""
+
+import pytest
+from http_client import create_client
+
+
+class TestCreateClient:
+    """Test cases for create_client."""
+
+    def test_sends_github_token_when_set(self, monkeypatch):
+        """Test that GITHUB_TOKEN is attached as an Authorization header."""
+        monkeypatch.setenv("GITHUB_TOKEN", "secret")
+
+        client = create_client()
+
+        assert client.headers["Authorization"] == "bearer secret"
+
+        client.close()
+
+    def test_no_auth_header_without_token(self, monkeypatch):
+        """Test that no Authorization header is sent without a token."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        client = create_client()
+
+        assert "Authorization" not in client.headers
+
+        client.close()
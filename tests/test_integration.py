@@ -7,6 +7,7 @@ from storage import RepoStorage
 from skill_generator import SkillGenerator
 
 
+@pytest.mark.slow
 class TestIntegration:
     """Integration tests for complete workflows."""
 
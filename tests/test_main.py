@@ -1,391 +1,169 @@
 """Tests for main module."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock, patch, call
-from pathlib import Path
+
+import main
+from config import ExtractionConfig
+from tests.fakes import (
+    FakeDetector, FakeExtractor, FakeScraper, FakeSkillGen, FakeStorage, FakeUI
+)
+
+
+@pytest.fixture(autouse=True)
+def app(monkeypatch, tmp_path):
+    """Replace every collaborator main() constructs with a fake.
+
+    Tests swap in their own fakes by assigning to the returned namespace
+    before calling main(). Logs go to the test's tmp_path, not the cwd.
+    """
+    monkeypatch.setattr(main, "LOG_FILE", str(tmp_path / "skill_scraper.log"))
+
+    fakes = SimpleNamespace(
+        ui=FakeUI(),
+        scraper=FakeScraper(),
+        storage=FakeStorage(),
+        skill_gen=FakeSkillGen(),
+        detector=FakeDetector(),
+        extractor=FakeExtractor()
+    )
+
+    monkeypatch.setattr(main, "RepoScraper", lambda **kwargs: fakes.scraper)
+    monkeypatch.setattr(main, "open_storage", lambda: fakes.storage)
+    monkeypatch.setattr(main, "RepoSelector", lambda: fakes.ui)
+    monkeypatch.setattr(main, "SkillGenerator", lambda: fakes.skill_gen)
+    monkeypatch.setattr(main, "SkillDetector", lambda **kwargs: fakes.detector)
+    monkeypatch.setattr(main, "SkillExtractor", lambda **kwargs: fakes.extractor)
+
+    return fakes
+
+
+# main() never mutates the repositories it is handed; tests slice this.
+REPOS = [
+    {
+        "owner": f"owner{i}",
+        "name": f"repo{i}",
+        "full_name": f"owner{i}/repo{i}",
+        "url": f"https://github.com/owner{i}/repo{i}"
+    }
+    for i in range(1, 4)
+]
 
 
 class TestMainWorkflow:
     """Test cases for main workflow."""
 
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_exit_immediately(self, mock_scraper_class, mock_storage_class,
-                                   mock_ui_class, mock_skill_gen_class):
-        """Test exiting immediately."""
-        from main import main
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.return_value = "exit"
-        mock_ui_class.return_value = mock_ui
-
-        mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
-
-        main()
-
-        mock_ui.select_action.assert_called_once()
-        mock_scraper.close.assert_called_once()
-
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_scrape_no_url(self, mock_scraper_class, mock_storage_class,
-                                mock_ui_class, mock_skill_gen_class):
-        """Test scrape action with no URL provided."""
-        from main import main
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.return_value = "scrape"
-        mock_ui.get_github_url.return_value = ""
-        mock_ui_class.return_value = mock_ui
-
-        mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
-
-        main()
-
-        mock_ui.select_action.assert_called_once()
-        mock_ui.get_github_url.assert_called_once()
-        mock_scraper.close.assert_called_once()
-
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_scrape_no_repos_found(self, mock_scraper_class, mock_storage_class,
-                                       mock_ui_class, mock_skill_gen_class):
-        """Test scrape action with no repositories found."""
-        from main import main
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.return_value = "scrape"
-        mock_ui.get_github_url.return_value = "https://github.com/owner/repo"
-        mock_ui_class.return_value = mock_ui
-
-        mock_scraper = MagicMock()
-        mock_scraper.scrape_awesome_repo.return_value = []
-        mock_scraper_class.return_value = mock_scraper
-
-        main()
-
-        mock_scraper.scrape_awesome_repo.assert_called_once()
-        mock_scraper.close.assert_called_once()
-
-    @patch('main.SkillExtractor')
-    @patch('main.SkillDetector')
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_scrape_success_no_details(self, mock_scraper_class, mock_storage_class,
-                                           mock_ui_class, mock_skill_gen_class,
-                                           mock_detector_class, mock_extractor_class):
+    @pytest.mark.parametrize("ui_kwargs, expected_calls", [
+        ({"action": "exit"}, ["select_action"]),
+        ({"action": "scrape", "url": ""}, ["select_action", "get_github_url"]),
+        (
+            {"action": "scrape", "url": "https://github.com/owner/repo"},
+            ["select_action", "get_github_url"]
+        ),
+        ({"error": KeyboardInterrupt()}, ["select_action"]),
+        ({"error": ValueError("Test error")}, ["select_action"]),
+    ], ids=["exit", "scrape-no-url", "scrape-no-repos", "keyboard-interrupt", "unexpected-error"])
+    def test_main_early_exit_paths(self, app, ui_kwargs, expected_calls):
+        """Test that main() stops early and still closes its clients."""
+        app.ui = FakeUI(**ui_kwargs)
+
+        main.main()
+
+        assert app.ui.calls == expected_calls
+        assert app.scraper.scraped == ([ui_kwargs["url"]] if ui_kwargs.get("url") else [])
+        assert app.scraper.closed == 1
+        assert app.detector.closed == 1
+
+    def test_main_scrape_success_no_details(self, app):
         """Test successful scrape without fetching details."""
-        from main import main
-        from config import ExtractionConfig
-
-        test_repos = [
-            {
-                "owner": "owner1",
-                "name": "repo1",
-                "full_name": "owner1/repo1",
-                "url": "https://github.com/owner1/repo1"
-            }
-        ]
-
-        config = ExtractionConfig.metadata_only()
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.return_value = "scrape"
-        mock_ui.get_github_url.return_value = "https://github.com/owner/awesome-list"
-        mock_ui.confirm_action.return_value = False
-        mock_ui.select_extraction_mode.return_value = config
-        mock_ui.select_repos.return_value = [test_repos[0]]
-        mock_ui_class.return_value = mock_ui
-
-        mock_scraper = MagicMock()
-        mock_scraper.scrape_awesome_repo.return_value = test_repos
-        mock_scraper_class.return_value = mock_scraper
-
-        mock_storage = MagicMock()
-        mock_storage_class.return_value = mock_storage
-
-        mock_skill_gen = MagicMock()
-        mock_skill_gen.generate_skill.return_value = True
-        mock_skill_gen.skills_dir = Path("~/.claude/skills")
-        mock_skill_gen_class.return_value = mock_skill_gen
-
-        mock_detector = MagicMock()
-        mock_detector_class.return_value = mock_detector
-
-        main()
-
-        mock_scraper.scrape_awesome_repo.assert_called_once()
-        mock_storage.save_repos.assert_called_once()
-        mock_skill_gen.generate_skill.assert_called_once()
-        mock_ui.show_summary.assert_called_once()
-
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_scrape_success_with_details(self, mock_scraper_class, mock_storage_class,
-                                             mock_ui_class, mock_skill_gen_class):
+        test_repos = REPOS[:1]
+
+        app.ui = FakeUI(
+            action="scrape",
+            url="https://github.com/owner/awesome-list",
+            fetch_details=False,
+            config=ExtractionConfig.metadata_only(),
+            selected=test_repos
+        )
+        app.scraper = FakeScraper(repos=test_repos)
+
+        main.main()
+
+        assert app.scraper.scraped == ["https://github.com/owner/awesome-list"]
+        assert app.scraper.fetched == []
+        assert len(app.storage.saved) == 1
+        assert app.skill_gen.generated == test_repos
+        assert app.ui.calls.count("show_summary") == 1
+
+    def test_main_scrape_success_with_details(self, app):
         """Test successful scrape with fetching details."""
-        from main import main
-
-        test_repos = [
-            {
-                "owner": "owner1",
-                "name": "repo1",
-                "full_name": "owner1/repo1",
-                "url": "https://github.com/owner1/repo1"
-            },
-            {
-                "owner": "owner2",
-                "name": "repo2",
-                "full_name": "owner2/repo2",
-                "url": "https://github.com/owner2/repo2"
-            }
-        ]
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.return_value = "scrape"
-        mock_ui.get_github_url.return_value = "https://github.com/owner/awesome-list"
-        mock_ui.confirm_action.return_value = True
-        mock_ui.select_repos.return_value = test_repos
-        mock_ui_class.return_value = mock_ui
-
-        mock_scraper = MagicMock()
-        mock_scraper.scrape_awesome_repo.return_value = test_repos
-        mock_scraper_class.return_value = mock_scraper
-
-        mock_storage = MagicMock()
-        mock_storage_class.return_value = mock_storage
-
-        mock_skill_gen = MagicMock()
-        mock_skill_gen.generate_skill.return_value = True
-        mock_skill_gen.skills_dir = Path("~/.claude/skills")
-        mock_skill_gen_class.return_value = mock_skill_gen
-
-        main()
-
-        assert mock_scraper.fetch_repo_details.call_count == 2
-        mock_storage.save_repos.assert_called_once()
-
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_load_no_file(self, mock_scraper_class, mock_storage_class,
-                               mock_ui_class, mock_skill_gen_class):
-        """Test load action with no existing file."""
-        from main import main
+        test_repos = REPOS[:2]
+
+        app.ui = FakeUI(
+            action="scrape",
+            url="https://github.com/owner/awesome-list",
+            fetch_details=True,
+            selected=test_repos
+        )
+        app.scraper = FakeScraper(repos=test_repos)
 
-        mock_ui = MagicMock()
-        mock_ui.select_action.return_value = "load"
-        mock_ui_class.return_value = mock_ui
+        main.main()
 
-        mock_storage = MagicMock()
-        mock_storage.exists.return_value = False
-        mock_storage_class.return_value = mock_storage
+        assert app.scraper.fetched == [test_repos]
+        assert len(app.storage.saved) == 1
 
-        mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
+    def test_main_load_no_file(self, app):
+        """Test load action with no existing file."""
+        app.ui = FakeUI(action="load")
+        app.storage = FakeStorage(repos=None)
 
-        main()
+        main.main()
 
-        mock_storage.exists.assert_called_once()
-        mock_scraper.close.assert_called_once()
+        assert app.storage.loads == 0
+        assert app.scraper.closed == 1
 
-    @patch('main.SkillExtractor')
-    @patch('main.SkillDetector')
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_load_success(self, mock_scraper_class, mock_storage_class,
-                               mock_ui_class, mock_skill_gen_class,
-                               mock_detector_class, mock_extractor_class):
+    def test_main_load_success(self, app):
         """Test successful load from storage."""
-        from main import main
-        from config import ExtractionConfig
-
-        test_repos = [
-            {
-                "owner": "owner1",
-                "name": "repo1",
-                "full_name": "owner1/repo1",
-                "url": "https://github.com/owner1/repo1"
-            }
-        ]
-
-        config = ExtractionConfig.metadata_only()
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.return_value = "load"
-        mock_ui.select_extraction_mode.return_value = config
-        mock_ui.select_repos.return_value = test_repos
-        mock_ui_class.return_value = mock_ui
-
-        mock_storage = MagicMock()
-        mock_storage.exists.return_value = True
-        mock_storage.load_repos.return_value = test_repos
-        mock_storage_class.return_value = mock_storage
-
-        mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
-
-        mock_skill_gen = MagicMock()
-        mock_skill_gen.generate_skill.return_value = True
-        mock_skill_gen.skills_dir = Path("~/.claude/skills")
-        mock_skill_gen_class.return_value = mock_skill_gen
-
-        mock_detector = MagicMock()
-        mock_detector_class.return_value = mock_detector
-
-        main()
-
-        mock_storage.load_repos.assert_called_once()
-        mock_skill_gen.generate_skill.assert_called_once()
-
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_no_repos_selected(self, mock_scraper_class, mock_storage_class,
-                                    mock_ui_class, mock_skill_gen_class):
+        test_repos = REPOS[:1]
+
+        app.ui = FakeUI(
+            action="load",
+            config=ExtractionConfig.metadata_only(),
+            selected=test_repos
+        )
+        app.storage = FakeStorage(repos=test_repos)
+
+        main.main()
+
+        assert app.storage.loads == 1
+        assert app.skill_gen.generated == test_repos
+
+    def test_main_no_repos_selected(self, app):
         """Test when no repositories are selected."""
-        from main import main
-
-        test_repos = [
-            {
-                "owner": "owner1",
-                "name": "repo1",
-                "full_name": "owner1/repo1",
-                "url": "https://github.com/owner1/repo1"
-            }
-        ]
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.return_value = "load"
-        mock_ui.select_repos.return_value = []
-        mock_ui_class.return_value = mock_ui
-
-        mock_storage = MagicMock()
-        mock_storage.exists.return_value = True
-        mock_storage.load_repos.return_value = test_repos
-        mock_storage_class.return_value = mock_storage
-
-        mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
-
-        main()
-
-        mock_storage.load_repos.assert_called_once()
-
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_keyboard_interrupt(self, mock_scraper_class, mock_storage_class,
-                                    mock_ui_class, mock_skill_gen_class):
-        """Test handling keyboard interrupt."""
-        from main import main
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.side_effect = KeyboardInterrupt()
-        mock_ui_class.return_value = mock_ui
-
-        mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
-
-        main()
-
-        mock_scraper.close.assert_called_once()
-
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_unexpected_error(self, mock_scraper_class, mock_storage_class,
-                                   mock_ui_class, mock_skill_gen_class):
-        """Test handling unexpected error."""
-        from main import main
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.side_effect = ValueError("Test error")
-        mock_ui_class.return_value = mock_ui
-
-        mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
-
-        main()
-
-        mock_scraper.close.assert_called_once()
-
-    @patch('main.SkillExtractor')
-    @patch('main.SkillDetector')
-    @patch('main.SkillGenerator')
-    @patch('main.RepoSelector')
-    @patch('main.RepoStorage')
-    @patch('main.RepoScraper')
-    def test_main_skill_generation_partial_failure(self, mock_scraper_class, mock_storage_class,
-                                                   mock_ui_class, mock_skill_gen_class,
-                                                   mock_detector_class, mock_extractor_class):
+        app.ui = FakeUI(action="load", selected=[])
+        app.storage = FakeStorage(repos=REPOS[:1])
+
+        main.main()
+
+        assert app.storage.loads == 1
+        assert app.skill_gen.generated == []
+        assert "show_summary" not in app.ui.calls
+
+    def test_main_skill_generation_partial_failure(self, app):
         """Test when some skills fail to generate."""
-        from main import main
-        from config import ExtractionConfig
-
-        test_repos = [
-            {
-                "owner": "owner1",
-                "name": "repo1",
-                "full_name": "owner1/repo1",
-                "url": "https://github.com/owner1/repo1"
-            },
-            {
-                "owner": "owner2",
-                "name": "repo2",
-                "full_name": "owner2/repo2",
-                "url": "https://github.com/owner2/repo2"
-            },
-            {
-                "owner": "owner3",
-                "name": "repo3",
-                "full_name": "owner3/repo3",
-                "url": "https://github.com/owner3/repo3"
-            }
-        ]
-
-        config = ExtractionConfig.metadata_only()
-
-        mock_ui = MagicMock()
-        mock_ui.select_action.return_value = "load"
-        mock_ui.select_extraction_mode.return_value = config
-        mock_ui.select_repos.return_value = test_repos
-        mock_ui_class.return_value = mock_ui
-
-        mock_storage = MagicMock()
-        mock_storage.exists.return_value = True
-        mock_storage.load_repos.return_value = test_repos
-        mock_storage_class.return_value = mock_storage
-
-        mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
-
-        mock_skill_gen = MagicMock()
-        mock_skill_gen.generate_skill.side_effect = [True, False, True]
-        mock_skill_gen.skills_dir = Path("~/.claude/skills")
-        mock_skill_gen_class.return_value = mock_skill_gen
-
-        mock_detector = MagicMock()
-        mock_detector_class.return_value = mock_detector
-
-        main()
-
-        mock_ui.show_summary.assert_called_once()
+        test_repos = REPOS
+
+        app.ui = FakeUI(
+            action="load",
+            config=ExtractionConfig.metadata_only(),
+            selected=test_repos
+        )
+        app.storage = FakeStorage(repos=test_repos)
+        app.skill_gen = FakeSkillGen(results=[True, False, True])
+
+        main.main()
+
+        assert app.ui.summary["total"] == 3
+        assert app.ui.summary["successful"] == 2
+        assert app.ui.summary["failed"] == 1
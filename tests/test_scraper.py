@@ -1,17 +1,12 @@
 """Tests for scraper module."""
 
+import json
+
+import httpx
 import pytest
 from scraper import RepoScraper
 
-
-class TestRepoScraper:
-    """Test cases for RepoScraper class."""
-
-    def test_extract_repos_from_markdown(self):
-        """Test extracting GitHub repos from markdown content."""
-        scraper = RepoScraper()
-
-        markdown = """
+_MD_LIST = """
 # Awesome List
 
 - [repo1](https://github.com/owner1/repo1) - Description 1
@@ -21,20 +16,7 @@ class TestRepoScraper:
 https://github.com/owner3/repo3
 """
 
-        repos = scraper._extract_repos(markdown)
-
-        assert len(repos) == 3
-        assert repos[0]["full_name"] == "owner1/repo1"
-        assert repos[1]["full_name"] == "owner2/repo2"
-        assert repos[2]["full_name"] == "owner3/repo3"
-
-        scraper.close()
-
-    def test_extract_first_paragraph(self):
-        """Test extracting first paragraph from markdown."""
-        scraper = RepoScraper()
-
-        markdown = """
+_MD_PARAGRAPH = """
 # Title
 
 Some badges and stuff
@@ -44,34 +26,109 @@ This is the first real paragraph with description.
 Another paragraph.
 """
 
-        result = scraper._extract_first_paragraph(markdown)
+
+@pytest.fixture(scope="module")
+def scraper():
+    """A RepoScraper shared by tests that only parse content."""
+    shared = RepoScraper()
+    yield shared
+    shared.close()
+
+
+@pytest.fixture(scope="module")
+def extracted_repos(scraper):
+    """Repositories parsed once from ``_MD_LIST``."""
+    return scraper._extract_repos(_MD_LIST)
+
+
+class TestRepoScraper:
+    """Test cases for RepoScraper class."""
+
+    def test_extract_repos_from_markdown(self, extracted_repos):
+        """Test extracting GitHub repos from markdown content."""
+        assert len(extracted_repos) == 3
+        assert extracted_repos[0]["full_name"] == "owner1/repo1"
+        assert extracted_repos[1]["full_name"] == "owner2/repo2"
+        assert extracted_repos[2]["full_name"] == "owner3/repo3"
+
+    def test_extract_repos_drops_trailing_period(self, scraper):
+        """Test that sentence punctuation is not captured in repo names."""
+        markdown = "See https://github.com/vercel/next.js. Also https://github.com/owner1/repo1."
+
+        repos = scraper._extract_repos(markdown)
+
+        assert [r["full_name"] for r in repos] == ["vercel/next.js", "owner1/repo1"]
+
+    def test_extract_repos_dedupes_case_and_punctuation(self, scraper):
+        """Test that links differing only in case or trailing punctuation merge."""
+        markdown = (
+            "See https://github.com/Torvalds/Linux, "
+            "https://github.com/torvalds/linux; and https://github.com/TORVALDS/LINUX:"
+        )
+
+        repos = scraper._extract_repos(markdown)
+
+        assert [r["full_name"] for r in repos] == ["Torvalds/Linux"]
+        assert repos[0]["url"] == "https://github.com/Torvalds/Linux"
+
+    def test_extract_repos_from_bytes_matches_text(self):
+        """Test that raw README bytes give the same repos as decoded text."""
+        bytes_scraper = RepoScraper()
+        text_scraper = RepoScraper()
+
+        markdown = "- [caf\u00e9](https://github.com/owner1/caf\u00e9)\n- https://github.com/owner2/repo2."
+
+        repos = bytes_scraper._extract_repos(markdown.encode())
+
+        assert repos == text_scraper._extract_repos(markdown)
+        assert [r["full_name"] for r in repos] == ["owner1/caf\u00e9", "owner2/repo2"]
+
+        bytes_scraper.close()
+        text_scraper.close()
+
+    def test_first_paragraph_from_lines(self, scraper):
+        """Test extracting first paragraph from markdown."""
+        result = scraper._first_paragraph_from_lines(_MD_PARAGRAPH.splitlines())
 
         assert "first real paragraph" in result.lower()
 
-        scraper.close()
+    def test_first_paragraph_strips_markdown(self, scraper):
+        """Test that links and emphasis are stripped from the paragraph."""
+        markdown = "A **fast** tool for [scraping](https://example.com) `awesome` lists"
 
-    def test_github_pattern_matching(self):
-        """Test GitHub URL pattern matching."""
-        scraper = RepoScraper()
+        result = scraper._first_paragraph_from_lines([markdown])
 
-        test_urls = [
-            "https://github.com/owner/repo",
-            "http://github.com/owner/repo",
-            "https://www.github.com/owner/repo",
-        ]
+        assert result == "A fast tool for scraping awesome lists"
 
-        for url in test_urls:
-            match = scraper.github_pattern.search(url)
-            assert match is not None
-            assert match.group(1) == "owner"
-            assert match.group(2) == "repo"
+    def test_extract_repos_returns_fresh_dicts_from_cache(self, scraper):
+        """Test that cached parse results are not shared between callers."""
+        markdown = "- [repo1](https://github.com/owner1/repo1)"
 
-        scraper.close()
+        first = scraper._extract_repos(markdown)
+        first[0]["description"] = "mutated"
+        second = scraper._extract_repos(markdown)
 
-    def test_remove_trailing_dots(self):
-        """Test that trailing dots are removed from repo names."""
-        scraper = RepoScraper()
+        assert second == [{
+            "owner": "owner1",
+            "name": "repo1",
+            "full_name": "owner1/repo1",
+            "url": "https://github.com/owner1/repo1",
+        }]
+
+    @pytest.mark.parametrize("url", [
+        "https://github.com/owner/repo",
+        "http://github.com/owner/repo",
+        "https://www.github.com/owner/repo",
+    ])
+    def test_github_pattern_matching(self, scraper, url):
+        """Test GitHub URL pattern matching."""
+        match = scraper.github_pattern.search(url)
+
+        assert match is not None
+        assert match.group(1, 2) == ("owner", "repo")
 
+    def test_remove_trailing_dots(self, scraper):
+        """Test that trailing dots are removed from repo names."""
         markdown = "Check out [repo](https://github.com/owner/repo)."
 
         repos = scraper._extract_repos(markdown)
@@ -80,4 +137,119 @@ Another paragraph.
         assert repos[0]["name"] == "repo"
         assert not repos[0]["name"].endswith(".")
 
+    def test_close_leaves_injected_client_open(self):
+        """Test that a client passed in by the caller is not closed."""
+        client = httpx.Client()
+        scraper = RepoScraper(client=client)
+
+        scraper.close()
+
+        assert not client.is_closed
+
+        client.close()
+
+    def test_fetch_many_updates_all_repos(self, monkeypatch):
+        """Test that fetch_many fetches details for every repository."""
+        scraper = RepoScraper()
+
+        def fake_fetch(repo):
+            repo["description"] = f"Description for {repo['name']}"
+            return repo
+
+        monkeypatch.setattr(scraper, "fetch_repo_details", fake_fetch)
+
+        repos = [
+            {"owner": "owner", "name": f"repo{i}", "full_name": f"owner/repo{i}"}
+            for i in range(5)
+        ]
+        completed = []
+
+        result = scraper.fetch_many(repos, max_workers=3, on_complete=completed.append)
+
+        assert result is repos
+        assert len(completed) == 5
+        assert all(r["description"] == f"Description for {r['name']}" for r in repos)
+
+        scraper.close()
+
+    def test_fetch_readme_caches_fallback_branch(self):
+        """Test that the master fallback branch is remembered per repository."""
+        scraper = RepoScraper()
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            if "/main/" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, text="# Readme")
+
+        scraper.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        for _ in range(2):
+            with scraper._open_readme("owner", "repo") as response:
+                assert response.status_code == 200
+
+        assert requested == [
+            "/owner/repo/main/README.md",
+            "/owner/repo/master/README.md",
+            "/owner/repo/master/README.md",
+        ]
+
+        scraper.close()
+
+    def test_fetch_repo_details_streams_readme(self):
+        """Test that repository descriptions are read from a streamed README."""
+        scraper = RepoScraper()
+
+        readme = "# Title\n\nA streamed description that is long enough.\n"
+        scraper.client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text=readme))
+        )
+
+        repo = scraper.fetch_repo_details(
+            {"owner": "owner", "name": "repo", "full_name": "owner/repo"}
+        )
+
+        assert repo["description"] == "A streamed description that is long enough."
+
+        scraper.close()
+
+    def test_fetch_repo_details_batch_uses_graphql(self):
+        """Test batched GraphQL lookup with README fallback for missing descriptions."""
+        scraper = RepoScraper()
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            if request.url.path == "/graphql":
+                payload = json.loads(request.content)
+                assert payload["variables"] == {
+                    "owner0": "owner", "name0": "described",
+                    "owner1": "owner", "name1": "bare",
+                }
+                return httpx.Response(200, json={"data": {
+                    "r0": {
+                        "description": "From the API",
+                        "defaultBranchRef": {"name": "trunk"},
+                        "skillMd": {"oid": "abc"},
+                    },
+                    "r1": {"description": None, "defaultBranchRef": {"name": "main"}, "skillMd": None},
+                }})
+            return httpx.Response(200, text="A description scraped from the README file.")
+
+        scraper.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        repos = [
+            {"owner": "owner", "name": "described", "full_name": "owner/described"},
+            {"owner": "owner", "name": "bare", "full_name": "owner/bare"},
+        ]
+
+        scraper.fetch_repo_details_batch(repos, token="token")
+
+        assert repos[0]["description"] == "From the API"
+        assert repos[0]["has_skill_md"] is True
+        assert repos[1]["description"] == "A description scraped from the README file."
+        assert repos[1]["has_skill_md"] is False
+        assert requested == ["/graphql", "/owner/bare/main/README.md"]
+
         scraper.close()
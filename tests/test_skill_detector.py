@@ -1,7 +1,18 @@
 """Tests for skill_detector module."""
 
+import json
+
+import httpx
 import pytest
-from skill_detector import SkillDetector
+from skill_detector import SkillDetector, count_skill_repos
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """A SkillDetector shared by tests that don't replace its client or methods."""
+    shared = SkillDetector()
+    yield shared
+    shared.close()
 
 
 class TestSkillDetector:
@@ -13,20 +24,196 @@ class TestSkillDetector:
         assert detector is not None
         detector.close()
 
-    def test_check_readme_indicators(self):
+    def test_check_readme_indicators(self, detector):
         """Test README keyword detection."""
-        detector = SkillDetector()
-
         indicators = detector._check_readme("anthropics", "skills")
 
         assert isinstance(indicators, list)
 
-        detector.close()
+    def test_check_readme_reports_overlapping_keywords(self):
+        """Test that keywords sharing characters are each reported once."""
+        readme = "Drop it in your Claude skills folder. See SKILL.md and skill.md."
+        client = httpx.Client(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=readme)
+        ))
+        detector = SkillDetector(client=client)
 
-    def test_detect_skills_structure(self):
-        """Test detection result structure."""
-        detector = SkillDetector()
+        indicators = detector._check_readme("owner", "repo")
+
+        keywords = [i["value"] for i in indicators if i["type"] == "readme_keyword"]
+        assert keywords == ["claude skill", "skill.md", "skills folder"]
+        assert indicators[-1] == {
+            "type": "readme_skill_md_mentions",
+            "value": 2,
+            "skill_count": 2
+        }
+
+        client.close()
+
+    def test_tree_check_reuses_branch_found_for_readme(self, monkeypatch):
+        """Test that the tree lookup skips the main probe once master is known."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if "/main/" in request.url.path:
+                return httpx.Response(404)
+            if request.url.host == "api.github.com":
+                return httpx.Response(200, json={"tree": [{"path": "skills/a/SKILL.md"}]})
+            return httpx.Response(200, text="Plain README")
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        branch_cache = {}
+        detector = SkillDetector(client=client, branch_cache=branch_cache)
+
+        detector.detect_skills({"owner": "owner", "name": "repo", "full_name": "owner/repo"})
+
+        assert paths == [
+            "/owner/repo/main/README.md",
+            "/owner/repo/master/README.md",
+            "/repos/owner/repo/git/trees/master",
+        ]
+        assert branch_cache == {"owner/repo": "master"}
+
+        client.close()
+
+    def test_detect_skills_records_skill_paths_from_complete_tree(self, monkeypatch):
+        """Test that SKILL.md paths are only reported when the tree is complete."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        trees = {
+            "empty": {"tree": [{"path": "README.md"}]},
+            "skills": {"tree": [{"path": "README.md"}, {"path": "pdf/SKILL.md"}]},
+            "huge": {"tree": [{"path": "README.md"}], "truncated": True},
+        }
+
+        def handler(request):
+            if request.url.host == "api.github.com":
+                return httpx.Response(200, json=trees[request.url.path.split("/")[3]])
+            return httpx.Response(200, text="Plain README")
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        detector = SkillDetector(client=client)
+
+        results = {
+            name: detector.detect_skills({"owner": "owner", "name": name, "full_name": f"owner/{name}"})
+            for name in trees
+        }
+
+        assert results["empty"]["skill_paths"] == []
+        assert results["skills"]["skill_paths"] == ["pdf/SKILL.md"]
+        assert "skill_paths" not in results["huge"]
+
+        client.close()
+
+    def test_detect_skills_trusts_scraped_skill_md_flag(self, monkeypatch):
+        """Test that without a token a scraped top-level SKILL.md skips the tree request."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            return httpx.Response(200, text="Plain README")
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        detector = SkillDetector(client=client)
 
+        result = detector.detect_skills(
+            {"owner": "owner", "name": "repo", "full_name": "owner/repo", "has_skill_md": True}
+        )
+
+        assert "api.github.com" not in hosts
+        assert result["is_skill_repo"] is True
+        assert result["skill_count"] == 1
+        assert "skill_paths" not in result
+
+        client.close()
+
+    def test_detect_skills_lists_tree_for_skill_md_flag_with_token(self):
+        """Test that with a token the tree is still listed, so nested skills are counted."""
+        def handler(request):
+            if request.url.path == "/graphql":
+                return httpx.Response(502)
+            if request.url.host == "api.github.com":
+                return httpx.Response(200, json={"tree": [
+                    {"path": "SKILL.md"}, {"path": "skills/pdf/SKILL.md"}
+                ]})
+            return httpx.Response(200, text="Plain README")
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        detector = SkillDetector(client=client, token="secret")
+
+        result = detector.detect_skills(
+            {"owner": "owner", "name": "repo", "full_name": "owner/repo", "has_skill_md": True}
+        )
+
+        assert [i["type"] for i in result["indicators"]] == ["repo_skill_md_files", "repo_skills_folder"]
+        assert result["skill_paths"] == ["SKILL.md", "skills/pdf/SKILL.md"]
+
+        client.close()
+
+    def test_detect_skills_uses_graphql_bundle_with_token(self):
+        """Test that one GraphQL request covers both README and tree checks."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"data": {"repository": {
+                "defaultBranchRef": {"name": "trunk"},
+                "readme": {"text": "A Claude Code skill collection"},
+                "tree": {"entries": [
+                    {"path": "README.md", "type": "blob"},
+                    {"path": "skills", "type": "tree", "object": {"entries": [
+                        {"path": "skills/pdf", "type": "tree", "object": {"entries": [
+                            {"path": "skills/pdf/SKILL.md", "type": "blob"},
+                        ]}},
+                    ]}},
+                ]},
+            }}})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        branch_cache = {}
+        detector = SkillDetector(client=client, branch_cache=branch_cache, token="secret")
+
+        result = detector.detect_skills({"owner": "owner", "name": "repo", "full_name": "owner/repo"})
+
+        assert len(requests) == 1
+        assert requests[0].url.path == "/graphql"
+        assert json.loads(requests[0].content)["variables"] == {"owner": "owner", "name": "repo"}
+        assert [i["type"] for i in result["indicators"]] == [
+            "readme_keyword", "repo_skill_md_files", "repo_skills_folder"
+        ]
+        assert result["indicators"][1]["paths"] == ["skills/pdf/SKILL.md"]
+        assert branch_cache == {"owner/repo": "trunk"}
+
+        client.close()
+
+    def test_graphql_bundle_falls_back_to_rest_tree_when_too_deep(self):
+        """Test that an unexpanded directory triggers the recursive REST tree."""
+        deep = {"path": "a/b/c/d", "type": "tree"}
+        for path in ["a/b/c", "a/b", "a"]:
+            deep = {"path": path, "type": "tree", "object": {"entries": [deep]}}
+
+        def handler(request):
+            if request.url.path == "/graphql":
+                return httpx.Response(200, json={"data": {"repository": {
+                    "defaultBranchRef": {"name": "main"},
+                    "readme": None,
+                    "tree": {"entries": [deep]},
+                }}})
+            return httpx.Response(200, json={"tree": [{"path": "a/b/c/d/e/SKILL.md"}]})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        detector = SkillDetector(client=client, token="secret")
+
+        result = detector.detect_skills({"owner": "owner", "name": "repo", "full_name": "owner/repo"})
+
+        assert result["indicators"][0]["paths"] == ["a/b/c/d/e/SKILL.md"]
+
+        client.close()
+
+    def test_detect_skills_structure(self, detector):
+        """Test detection result structure."""
         test_repo = {
             "owner": "test",
             "name": "test-repo",
@@ -47,6 +234,28 @@ class TestSkillDetector:
         assert isinstance(result["confidence"], float)
         assert isinstance(result["indicators"], list)
 
+    def test_detect_many_keys_results_in_input_order(self, monkeypatch):
+        """Test that detect_many checks every repo and preserves order."""
+        detector = SkillDetector()
+
+        def fake_detect(repo):
+            return {"is_skill_repo": repo["name"].endswith("skills")}
+
+        monkeypatch.setattr(detector, "detect_skills", fake_detect)
+
+        repos = [
+            {"owner": "owner", "name": name, "full_name": f"owner/{name}"}
+            for name in ["tools", "skills", "more-skills"]
+        ]
+        checked = []
+
+        results = detector.detect_many(repos, max_workers=2, on_complete=checked.append)
+
+        assert list(results) == ["owner/tools", "owner/skills", "owner/more-skills"]
+        assert [r["is_skill_repo"] for r in results.values()] == [False, True, True]
+        assert len(checked) == 3
+        assert count_skill_repos(results) == 2
+
         detector.close()
 
     def test_close_detector(self):
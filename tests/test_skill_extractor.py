@@ -1,34 +1,95 @@
 """Tests for skill_extractor module."""
 
+import shutil
+import subprocess
+
 import pytest
 from pathlib import Path
 from skill_extractor import SkillExtractor
 from config import ExtractionConfig
 
 
+@pytest.fixture
+def extractor(skills_dir):
+    """A metadata-only extractor installing into a per-test skills dir."""
+    extractor = SkillExtractor(str(skills_dir), ExtractionConfig.metadata_only())
+    yield extractor
+    extractor.cleanup_staging()
+
+
+@pytest.fixture
+def make_extractor():
+    """Build extractors for a test and clean up their staging dirs afterwards."""
+    made = []
+
+    def make(*args, **kwargs):
+        extractor = SkillExtractor(*args, **kwargs)
+        made.append(extractor)
+        return extractor
+
+    yield make
+    for extractor in made:
+        extractor.cleanup_staging()
+
+
+@pytest.fixture(scope="session")
+def sample_skill_tree(tmp_path_factory):
+    """A small skill folder with files the extractor should and shouldn't copy.
+
+    Built once per session; tests only read from it.
+    """
+    source = tmp_path_factory.mktemp("tpl") / "source"
+    source.mkdir()
+
+    (source / "SKILL.md").write_text("# Test")
+    (source / "script.py").write_text("print('hello')")
+
+    subfolder = source / "resources"
+    subfolder.mkdir()
+    (subfolder / "data.json").write_text("{}")
+
+    (source / ".hidden").write_text("should be ignored")
+    (source / "__pycache__").mkdir()
+
+    return source
+
+
 class TestSkillExtractor:
     """Test cases for SkillExtractor class."""
 
-    def test_extractor_initialization(self, tmp_path):
+    def test_extractor_initialization(self, make_extractor, tmp_path):
         """Test extractor can be initialized."""
         skills_dir = tmp_path / "skills"
         config = ExtractionConfig.metadata_only()
 
-        extractor = SkillExtractor(str(skills_dir), config)
+        extractor = make_extractor(str(skills_dir), config)
 
         assert extractor.skills_dir == skills_dir
         assert extractor.config == config
         assert skills_dir.exists()
 
-    def test_extractor_with_default_config(self, tmp_path):
+    def test_extractor_with_default_config(self, make_extractor, tmp_path):
         """Test extractor with default config."""
         skills_dir = tmp_path / "skills"
 
-        extractor = SkillExtractor(str(skills_dir))
+        extractor = make_extractor(str(skills_dir))
 
         assert extractor.config.mode == "metadata"
 
-    def test_find_skill_files(self, tmp_path):
+    def test_staging_fs_holds_staging_dir(self, make_extractor, tmp_path):
+        """Test that staging sits next to the skills dir unless staging_fs is set."""
+        scratch = tmp_path / "scratch"
+        scratch.mkdir()
+        config = ExtractionConfig(staging_fs=str(scratch))
+
+        default = make_extractor(str(tmp_path / "skills"))
+        extractor = make_extractor(str(tmp_path / "skills"), config)
+
+        assert default.staging_dir.parent == tmp_path
+        assert default.scratch_dir is None
+        assert extractor.staging_dir.parent == scratch
+
+    def test_find_skill_files(self, extractor, tmp_path):
         """Test finding SKILL.md files."""
         repo_dir = tmp_path / "test-repo"
         repo_dir.mkdir()
@@ -43,22 +104,37 @@ class TestSkillExtractor:
         git_folder.mkdir()
         (git_folder / "SKILL.md").write_text("# Should be ignored")
 
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(tmp_path / "skills"), config)
-
         skill_files = extractor._find_skill_files(repo_dir)
 
         assert len(skill_files) == 2
         assert all(f.name == "SKILL.md" for f in skill_files)
         assert not any(".git" in str(f) for f in skill_files)
 
-    def test_determine_skill_name_simple(self, tmp_path):
-        """Test skill name determination for simple case."""
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(tmp_path / "skills"), config)
+    def test_find_skill_files_prunes_dependency_dirs(self, extractor, tmp_path):
+        """Test that vendored directories are skipped and results are sorted."""
+        repo_dir = tmp_path / "test-repo"
 
+        for folder in [
+            "skills/zeta", "skills/alpha", "skills/build", "dist/skill",
+            "node_modules/pkg", ".venv/lib", "venv/lib", ".tox/py312"
+        ]:
+            (repo_dir / folder).mkdir(parents=True)
+            (repo_dir / folder / "SKILL.md").write_text("# Skill")
+
+        skill_files = extractor._find_skill_files(repo_dir)
+
+        # build/ and dist/ can be real skill folders, so they are kept.
+        assert skill_files == [
+            repo_dir / "dist" / "skill" / "SKILL.md",
+            repo_dir / "skills" / "alpha" / "SKILL.md",
+            repo_dir / "skills" / "build" / "SKILL.md",
+            repo_dir / "skills" / "zeta" / "SKILL.md",
+        ]
+
+    def test_determine_skill_name_simple(self, extractor, tmp_path):
+        """Test skill name determination for simple case."""
         skill_folder = tmp_path / "test-skill"
-        relative_path = Path("test-skill")
+        relative_parts = ("test-skill",)
 
         source_repo = {
             "owner": "testowner",
@@ -68,19 +144,16 @@ class TestSkillExtractor:
 
         skill_name = extractor._determine_skill_name(
             skill_folder,
-            relative_path,
+            relative_parts,
             source_repo
         )
 
         assert skill_name == "testowner-test-skill"
 
-    def test_determine_skill_name_from_skills_folder(self, tmp_path):
+    def test_determine_skill_name_from_skills_folder(self, extractor, tmp_path):
         """Test skill name determination from skills folder."""
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(tmp_path / "skills"), config)
-
         skill_folder = tmp_path / "skills" / "my-skill"
-        relative_path = Path("skills") / "my-skill"
+        relative_parts = ("skills", "my-skill")
 
         source_repo = {
             "owner": "testowner",
@@ -90,34 +163,80 @@ class TestSkillExtractor:
 
         skill_name = extractor._determine_skill_name(
             skill_folder,
-            relative_path,
+            relative_parts,
             source_repo
         )
 
         assert skill_name == "testowner-my-skill"
 
-    def test_copy_skill_files(self, tmp_path):
-        """Test copying skill files."""
+    def test_staging_lock_is_per_skill(self, extractor):
+        """Test that only skills staged into the same folder share a lock."""
+        assert extractor._staging_lock("owner-pdf") is extractor._staging_lock("owner-pdf")
+        assert extractor._staging_lock("owner-pdf") is not extractor._staging_lock("owner-docx")
+
+    def test_sparse_dirs_from_detection(self, extractor):
+        """Test that sparse checkout targets the SKILL.md folders only."""
+        nested = {"skill_paths": ["skills/pdf/SKILL.md", "skills/xlsx/SKILL.md", "skills/pdf/SKILL.md"]}
+        at_root = {"skill_paths": ["SKILL.md"]}
+        # A truncated tree listing only reports indicators, never skill_paths.
+        truncated = {"indicators": [{"type": "repo_skill_md_files", "paths": ["skills/pdf/SKILL.md"]}]}
+
+        assert extractor._sparse_dirs(nested) == ["skills/pdf", "skills/xlsx"]
+        assert extractor._sparse_dirs(at_root) is None
+        assert extractor._sparse_dirs(truncated) is None
+        assert extractor._sparse_dirs({}) is None
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_sparse_clone_checks_out_only_skill_dirs(self, extractor, tmp_path):
+        """Test that a sparse clone leaves unrelated directories out."""
         source = tmp_path / "source"
-        source.mkdir()
+        (source / "skills" / "pdf").mkdir(parents=True)
+        (source / "other").mkdir()
+        (source / "skills" / "pdf" / "SKILL.md").write_text("# PDF")
+        (source / "other" / "data.bin").write_text("unrelated")
 
-        (source / "SKILL.md").write_text("# Test")
-        (source / "script.py").write_text("print('hello')")
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run(["git", "init", "-q", str(source)], check=True)
+        subprocess.run(git + ["-C", str(source), "add", "."], check=True)
+        subprocess.run(git + ["-C", str(source), "commit", "-qm", "init"], check=True)
+
+        target = tmp_path / "clone"
+
+        assert extractor._clone_repo(source.as_uri(), target, ["skills/pdf"])
+        assert (target / "skills" / "pdf" / "SKILL.md").exists()
+        assert not (target / "other").exists()
+
+    def test_clone_repo_submodule_flags(self, make_extractor, tmp_path, monkeypatch):
+        """Test that submodule flags are only passed when enabled."""
+        commands = []
 
-        subfolder = source / "resources"
-        subfolder.mkdir()
-        (subfolder / "data.json").write_text("{}")
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
 
-        (source / ".hidden").write_text("should be ignored")
-        (source / "__pycache__").mkdir()
+        monkeypatch.setattr(subprocess, "run", fake_run)
 
+        plain = make_extractor(str(tmp_path / "skills"), ExtractionConfig())
+        recursive = make_extractor(
+            str(tmp_path / "skills"),
+            ExtractionConfig(recurse_submodules=True, clone_jobs=6)
+        )
+
+        assert plain._clone_repo("https://github.com/o/r", tmp_path / "a")
+        assert recursive._clone_repo("https://github.com/o/r", tmp_path / "b")
+
+        assert "--no-tags" in commands[0]
+        assert "--recurse-submodules" not in commands[0]
+        assert "--filter=blob:none" not in commands[0]
+        assert {"--recurse-submodules", "--shallow-submodules", "--jobs=6"} <= set(commands[1])
+
+    def test_copy_skill_files(self, extractor, sample_skill_tree, tmp_path):
+        """Test copying skill files."""
         target = tmp_path / "target"
         target.mkdir()
 
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(tmp_path / "skills"), config)
-
-        extractor._copy_skill_files(source, target)
+        extractor._copy_skill_files(sample_skill_tree, target)
 
         assert (target / "SKILL.md").exists()
         assert (target / "script.py").exists()
@@ -125,12 +244,30 @@ class TestSkillExtractor:
         assert not (target / ".hidden").exists()
         assert not (target / "__pycache__").exists()
 
-    def test_extraction_result_structure(self, tmp_path):
-        """Test extraction result structure."""
-        skills_dir = tmp_path / "skills"
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(skills_dir), config)
+    def test_copy_skill_files_large_tree(self, extractor, tmp_path):
+        """Test that large nested skill folders are copied completely."""
+        source = tmp_path / "source"
+        (source / "references" / "nested").mkdir(parents=True)
+        (source / "references" / "empty").mkdir()
+        (source / "SKILL.md").write_text("# Test")
+
+        for i in range(40):
+            (source / "references" / "nested" / f"ref{i}.md").write_text(f"ref {i}")
+
+        target = tmp_path / "target"
+        target.mkdir()
+
+        extractor._copy_skill_files(source, target)
+
+        copied = sorted(p.name for p in (target / "references" / "nested").iterdir())
+
+        assert copied == sorted(f"ref{i}.md" for i in range(40))
+        assert (target / "references" / "nested" / "ref7.md").read_text() == "ref 7"
+        assert (target / "references" / "empty").is_dir()
+        assert (target / "SKILL.md").exists()
 
+    def test_extraction_result_structure(self, extractor):
+        """Test extraction result structure."""
         test_repo = {
             "owner": "test",
             "name": "test-repo",
@@ -156,12 +293,143 @@ class TestSkillExtractor:
         assert isinstance(result["extracted_count"], int)
         assert isinstance(result["skills"], list)
 
-    def test_parse_skill_metadata_with_frontmatter(self, tmp_path):
-        """Test parsing skill metadata with frontmatter."""
+    def test_extract_skills_batch(self, make_extractor, tmp_path, monkeypatch):
+        """Test that batch extraction returns results for every repo in input order."""
+        config = ExtractionConfig.extract_all()
+        extractor = make_extractor(str(tmp_path / "skills"), config)
+
+        def fake_extract(repo, detection_result):
+            return {"success": True, "extracted_count": detection_result["skill_count"]}
+
+        monkeypatch.setattr(extractor, "extract_skills", fake_extract)
+
+        repos = [
+            {"owner": "owner", "name": f"repo{i}", "full_name": f"owner/repo{i}"}
+            for i in range(5)
+        ]
+        detection_results = {f"owner/repo{i}": {"skill_count": i} for i in range(5)}
+        completed = []
+
+        results = extractor.extract_skills_batch(
+            repos, detection_results, on_complete=lambda repo, result: completed.append(repo)
+        )
+
+        assert list(results) == [repo["full_name"] for repo in repos]
+        assert [r["extracted_count"] for r in results.values()] == [0, 1, 2, 3, 4]
+        assert len(completed) == 5
+
+    def test_extract_skills_batch_clones_duplicates_once(self, make_extractor, tmp_path, monkeypatch):
+        """Test that a repository listed twice in a batch is extracted once."""
+        config = ExtractionConfig.extract_all()
+        extractor = make_extractor(str(tmp_path / "skills"), config)
+        extracted = []
+
+        def fake_extract(repo, detection_result):
+            extracted.append(repo["full_name"])
+            return {"success": True, "extracted_count": 1}
+
+        monkeypatch.setattr(extractor, "extract_skills", fake_extract)
+
+        repos = [
+            {"owner": "Owner", "name": "Repo", "full_name": "Owner/Repo"},
+            {"owner": "owner", "name": "repo", "full_name": "owner/repo"},
+        ]
+
+        results = extractor.extract_skills_batch(repos, {})
+
+        assert extracted == ["Owner/Repo"]
+        assert list(results) == ["Owner/Repo"]
+
+    def test_filter_new_skips_fully_installed_repos(self, make_extractor, tmp_path):
+        """Test that repos whose detected skills all exist are not cloned."""
         skills_dir = tmp_path / "skills"
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(skills_dir), config)
+        (skills_dir / "owner-pdf").mkdir(parents=True)
+        extractor = make_extractor(str(skills_dir), ExtractionConfig.extract_all())
+
+        def detected(*paths):
+            return {"skill_paths": list(paths)}
+
+        repos = [
+            {"owner": "owner", "name": name, "full_name": f"owner/{name}"}
+            for name in ["installed", "partial", "root", "truncated", "unknown"]
+        ]
+        detection_results = {
+            "owner/installed": detected("skills/pdf/SKILL.md"),
+            "owner/partial": detected("skills/pdf/SKILL.md", "skills/docx/SKILL.md"),
+            "owner/root": detected("SKILL.md"),
+            # A truncated listing that only shows installed skills may hide new ones.
+            "owner/truncated": {"indicators": [
+                {"type": "repo_skill_md_files", "paths": ["skills/pdf/SKILL.md"]}
+            ]},
+        }
+
+        kept = extractor.filter_new(repos, detection_results)
+
+        assert [r["name"] for r in kept] == ["partial", "root", "truncated", "unknown"]
+
+        updating = make_extractor(str(skills_dir), ExtractionConfig(update_existing=True))
+        assert updating.filter_new(repos, detection_results) == repos
+
+    def test_enrich_skill_metadata(self, extractor, tmp_path):
+        """Test that the footer is appended unless the skill already records its source."""
+        repo = {"full_name": "owner/repo", "url": "https://github.com/owner/repo"}
+
+        plain = tmp_path / "plain.md"
+        plain.write_text("# Plain\n")
+        tagged = tmp_path / "tagged.md"
+        tagged.write_text("# Tagged\nExtracted-From: elsewhere\n")
+
+        content = extractor._enrich_skill_metadata(plain, repo, "owner-plain", {"confidence": 0.5})
+
+        assert content == plain.read_text()
+        assert content.startswith("# Plain\n")
+        assert "**Extracted from**: [owner/repo](https://github.com/owner/repo)" in content
+        assert "**Detection confidence**: 50%" in content
+
+        assert extractor._enrich_skill_metadata(tagged, repo, "owner-tagged", {}) == tagged.read_text()
+        assert tagged.read_text() == "# Tagged\nExtracted-From: elsewhere\n"
+
+    def test_extract_skills_skips_clone_without_skill_paths(self, make_extractor, tmp_path, monkeypatch):
+        """Test that repos whose tree has no SKILL.md are never cloned."""
+        extractor = make_extractor(str(tmp_path / "skills"), ExtractionConfig.extract_all())
+
+        def fail_clone(*args):
+            raise AssertionError("should not clone")
 
+        monkeypatch.setattr(extractor, "_clone_repo", fail_clone)
+
+        result = extractor.extract_skills(
+            {"owner": "owner", "name": "repo", "url": "https://github.com/owner/repo"},
+            {"skill_paths": []}
+        )
+
+        assert result["success"] is False
+        assert result["extracted_count"] == 0
+
+    def test_recurse_submodules_ignores_host_skill_paths(self, make_extractor, tmp_path, monkeypatch):
+        """Test that skills possibly inside submodules are always cloned in full."""
+        config = ExtractionConfig(mode="extract", recurse_submodules=True)
+        skills_dir = tmp_path / "skills"
+        (skills_dir / "owner-pdf").mkdir(parents=True)
+        extractor = make_extractor(str(skills_dir), config)
+        clones = []
+
+        def fake_clone(url, target_dir, sparse_dirs=None):
+            clones.append(sparse_dirs)
+            return False
+
+        monkeypatch.setattr(extractor, "_clone_repo", fake_clone)
+        repo = {"owner": "owner", "name": "repo", "full_name": "owner/repo",
+                "url": "https://github.com/owner/repo"}
+
+        extractor.extract_skills(repo, {"skill_paths": []})
+        extractor.extract_skills(repo, {"skill_paths": ["skills/pdf/SKILL.md"]})
+
+        assert clones == [None, None]
+        assert extractor.filter_new([repo], {"owner/repo": {"skill_paths": ["skills/pdf/SKILL.md"]}}) == [repo]
+
+    def test_parse_skill_metadata_with_frontmatter(self, extractor, tmp_path):
+        """Test parsing skill metadata with frontmatter."""
         skill_md = tmp_path / "SKILL.md"
         skill_md.write_text("""---
 name: Test Skill
@@ -178,12 +446,8 @@ This is a test skill.""")
         assert metadata["description"] == "A test skill for testing"
         assert "Test Skill" in metadata["content"]
 
-    def test_parse_skill_metadata_without_frontmatter(self, tmp_path):
+    def test_parse_skill_metadata_without_frontmatter(self, extractor, tmp_path):
         """Test parsing skill metadata without frontmatter."""
-        skills_dir = tmp_path / "skills"
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(skills_dir), config)
-
         skill_md = tmp_path / "SKILL.md"
         skill_md.write_text("""# My Skill
 This is the description from the content.""")
@@ -192,12 +456,21 @@ This is the description from the content.""")
 
         assert "This is the description from the content." in metadata["description"]
 
-    def test_get_staged_skills(self, tmp_path):
-        """Test getting staged skills."""
-        skills_dir = tmp_path / "skills"
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(skills_dir), config)
+    def test_parse_skill_metadata_frontmatter_edge_cases(self, extractor, tmp_path):
+        """Test frontmatter delimiters that must or must not close the block."""
+        padded = extractor._parse_skill_metadata(
+            tmp_path / "SKILL.md", content="---  \n\nname: Padded\ndescription: a: b\n---\t\nBody"
+        )
+        unclosed = extractor._parse_skill_metadata(
+            tmp_path / "SKILL.md", content="---\nname: Unclosed\n---"
+        )
+
+        assert padded["name"] == "Padded"
+        assert padded["description"] == "a: b"
+        assert unclosed["name"] == ""
 
+    def test_get_staged_skills(self, extractor):
+        """Test getting staged skills."""
         skill1 = extractor.staging_dir / "skill1"
         skill1.mkdir(parents=True)
         (skill1 / "SKILL.md").write_text("""---
@@ -221,11 +494,9 @@ description: Second skill
         assert all("staging_path" in s for s in staged_skills)
         assert all("final_path" in s for s in staged_skills)
 
-    def test_install_skills(self, tmp_path):
+    def test_install_skills(self, extractor):
         """Test installing skills from staging."""
-        skills_dir = tmp_path / "skills"
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(skills_dir), config)
+        skills_dir = extractor.skills_dir
 
         skill_staging = extractor.staging_dir / "test-skill"
         skill_staging.mkdir(parents=True)
@@ -242,13 +513,10 @@ description: Second skill
         assert result["success"] == 1
         assert result["failed"] == 0
         assert (skills_dir / "test-skill" / "SKILL.md").exists()
+        assert not skill_staging.exists()
 
-    def test_cleanup_staging(self, tmp_path):
+    def test_cleanup_staging(self, extractor):
         """Test cleanup of staging directory."""
-        skills_dir = tmp_path / "skills"
-        config = ExtractionConfig.metadata_only()
-        extractor = SkillExtractor(str(skills_dir), config)
-
         staging_dir = extractor.staging_dir
         assert staging_dir.exists()
 
@@ -258,16 +526,18 @@ description: Second skill
 
         assert not staging_dir.exists()
 
-    def test_local_installation_path(self, tmp_path):
-        """Test local installation path configuration."""
-        config = ExtractionConfig(install_location="local")
-        extractor = SkillExtractor(config=config)
-
-        assert ".claude/skills" in str(extractor.skills_dir)
+    @pytest.mark.parametrize("install_location", ["local", "global"])
+    def test_installation_path(self, make_extractor, install_location, tmp_path, monkeypatch):
+        """Test local and global installation path configuration."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        config = ExtractionConfig(install_location=install_location)
+        extractor = make_extractor(config=config)
 
-    def test_global_installation_path(self, tmp_path):
-        """Test global installation path configuration."""
-        config = ExtractionConfig(install_location="global")
-        extractor = SkillExtractor(config=config)
+        expected = {
+            "local": Path(".claude/skills"),
+            "global": tmp_path / "home" / ".claude" / "skills",
+        }[install_location]
 
+        assert extractor.skills_dir == expected
         assert ".claude/skills" in str(extractor.skills_dir)
@@ -1,5 +1,7 @@
 """Tests for skill_generator module."""
 
+import shutil
+
 import pytest
 from pathlib import Path
 from skill_generator import SkillGenerator
@@ -8,9 +10,8 @@ from skill_generator import SkillGenerator
 class TestSkillGenerator:
     """Test cases for SkillGenerator class."""
 
-    def test_generate_skill(self, tmp_path):
+    def test_generate_skill(self, skills_dir):
         """Test generating a skill."""
-        skills_dir = tmp_path / "skills"
         generator = SkillGenerator(str(skills_dir))
 
         test_repo = {
@@ -37,9 +38,8 @@ class TestSkillGenerator:
         assert "description: A test repository" in content
         assert "https://github.com/testowner/testrepo" in content
 
-    def test_generate_duplicate_skill(self, tmp_path):
+    def test_generate_duplicate_skill(self, skills_dir):
         """Test that duplicate skills are not created."""
-        skills_dir = tmp_path / "skills"
         generator = SkillGenerator(str(skills_dir))
 
         test_repo = {
@@ -56,9 +56,34 @@ class TestSkillGenerator:
         result2 = generator.generate_skill(test_repo)
         assert result2 is False
 
-    def test_remove_skill(self, tmp_path):
+    def test_generate_skills_batch(self, skills_dir):
+        """Test generating many skills at once, in order, with duplicates skipped."""
+        generator = SkillGenerator(str(skills_dir))
+
+        test_repos = [
+            {
+                "owner": f"owner{i}",
+                "name": f"repo{i}",
+                "full_name": f"owner{i}/repo{i}",
+                "url": f"https://github.com/owner{i}/repo{i}",
+                "description": f"Repository {i}"
+            }
+            for i in (2, 1, 3)
+        ]
+        completed = []
+
+        results = generator.generate_skills(
+            test_repos + test_repos[:1],
+            on_complete=lambda repo, success: completed.append((repo["name"], success))
+        )
+
+        assert results == [True, True, True, False]
+        assert completed == [("repo2", True), ("repo1", True), ("repo3", True), ("repo2", False)]
+        assert generator.list_installed_skills() == ["owner1-repo1", "owner2-repo2", "owner3-repo3"]
+        assert "Repository 3" in (skills_dir / "owner3-repo3" / "SKILL.md").read_text()
+
+    def test_remove_skill(self, skills_dir):
         """Test removing a skill."""
-        skills_dir = tmp_path / "skills"
         generator = SkillGenerator(str(skills_dir))
 
         test_repo = {
@@ -79,9 +104,29 @@ class TestSkillGenerator:
 
         assert not skill_folder.exists()
 
-    def test_remove_nonexistent_skill(self, tmp_path):
+    def test_remove_skill_with_extra_files(self, skills_dir):
+        """Test that skill folders holding more than SKILL.md are removed whole."""
+        generator = SkillGenerator(str(skills_dir))
+
+        test_repo = {
+            "owner": "testowner",
+            "name": "testrepo",
+            "full_name": "testowner/testrepo",
+            "url": "https://github.com/testowner/testrepo",
+            "description": "A test repository"
+        }
+
+        generator.generate_skill(test_repo)
+
+        skill_folder = skills_dir / "testowner-testrepo"
+        (skill_folder / "references").mkdir()
+        (skill_folder / "references" / "notes.md").write_text("notes")
+
+        assert generator.remove_skill(test_repo) is True
+        assert not skill_folder.exists()
+
+    def test_remove_nonexistent_skill(self, skills_dir):
         """Test removing a non-existent skill."""
-        skills_dir = tmp_path / "skills"
         generator = SkillGenerator(str(skills_dir))
 
         test_repo = {
@@ -95,9 +140,8 @@ class TestSkillGenerator:
         result = generator.remove_skill(test_repo)
         assert result is False
 
-    def test_list_installed_skills(self, tmp_path):
+    def test_list_installed_skills(self, skills_dir):
         """Test listing installed skills."""
-        skills_dir = tmp_path / "skills"
         generator = SkillGenerator(str(skills_dir))
 
         test_repos = [
@@ -126,9 +170,68 @@ class TestSkillGenerator:
         assert "owner1-repo1" in skills
         assert "owner2-repo2" in skills
 
-    def test_skill_content_format(self, tmp_path):
+    def test_generate_skill_skips_preexisting_folder(self, skills_dir):
+        """Test that skills installed before the generator started are skipped."""
+        (skills_dir / "testowner-testrepo").mkdir(parents=True)
+        generator = SkillGenerator(str(skills_dir))
+
+        test_repo = {
+            "owner": "testowner",
+            "name": "testrepo",
+            "full_name": "testowner/testrepo",
+            "url": "https://github.com/testowner/testrepo",
+            "description": "A test repository"
+        }
+
+        assert generator.generate_skill(test_repo) is False
+        assert generator.generate_skill(test_repo, update=True) is True
+        assert generator.remove_skill(test_repo) is True
+        assert generator.generate_skill(test_repo) is True
+
+    def test_generate_skill_after_external_removal(self, skills_dir):
+        """Test that a skill folder deleted by another process is recreated."""
+        generator = SkillGenerator(str(skills_dir))
+
+        test_repo = {
+            "owner": "testowner",
+            "name": "testrepo",
+            "full_name": "testowner/testrepo",
+            "url": "https://github.com/testowner/testrepo",
+            "description": "A test repository"
+        }
+
+        assert generator.generate_skill(test_repo) is True
+        shutil.rmtree(skills_dir / "testowner-testrepo")
+
+        assert generator.generate_skill(test_repo, update=True) is True
+        assert (skills_dir / "testowner-testrepo" / "SKILL.md").exists()
+
+    def test_failed_update_keeps_existing_skill(self, skills_dir, monkeypatch):
+        """Test that a failed rewrite leaves the previous SKILL.md intact."""
+        generator = SkillGenerator(str(skills_dir))
+
+        test_repo = {
+            "owner": "testowner",
+            "name": "testrepo",
+            "full_name": "testowner/testrepo",
+            "url": "https://github.com/testowner/testrepo",
+            "description": "Original"
+        }
+
+        generator.generate_skill(test_repo)
+        skill_folder = skills_dir / "testowner-testrepo"
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("skill_generator.os.replace", fail_replace)
+
+        assert generator.generate_skill({**test_repo, "description": "New"}, update=True) is False
+        assert "description: Original" in (skill_folder / "SKILL.md").read_text()
+        assert [p.name for p in skill_folder.iterdir()] == ["SKILL.md"]
+
+    def test_skill_content_format(self, skills_dir):
         """Test that skill content has correct format."""
-        skills_dir = tmp_path / "skills"
         generator = SkillGenerator(str(skills_dir))
 
         test_repo = {
@@ -147,3 +250,19 @@ class TestSkillGenerator:
         assert content.startswith("---\n")
         assert "---\n" in content[4:]
         assert "# testowner/testrepo" in content
+
+    def test_skill_content_keeps_braces_in_description(self, skills_dir):
+        """Test that template syntax in a description is written verbatim."""
+        generator = SkillGenerator(str(skills_dir))
+
+        test_repo = {
+            "owner": "testowner",
+            "name": "testrepo",
+            "full_name": "testowner/testrepo",
+            "url": "https://github.com/testowner/testrepo",
+            "description": "Renders {name} and ${owner} placeholders"
+        }
+
+        content = generator._create_skill_content(test_repo)
+
+        assert "description: Renders {name} and ${owner} placeholders" in content
@@ -3,7 +3,8 @@
 import json
 import pytest
 from pathlib import Path
-from storage import RepoStorage
+import storage as storage_module
+from storage import JsonlRepoStorage, RepoStorage, SqliteRepoStorage, open_storage
 
 
 class TestRepoStorage:
@@ -61,19 +62,35 @@ class TestRepoStorage:
 
         assert storage.exists()
 
-    def test_save_empty_list(self, tmp_path):
+    @pytest.mark.parametrize("json_module", ["json", "orjson", "ujson"])
+    def test_save_empty_list(self, tmp_path, json_module):
         """Test saving empty repository list."""
+        loads = pytest.importorskip(json_module).loads
         storage_file = tmp_path / "empty.json"
         storage = RepoStorage(str(storage_file))
 
         storage.save_repos([])
 
         assert storage_file.exists()
+        assert loads(storage_file.read_bytes()) == []
 
-        with open(storage_file, 'r') as f:
-            content = json.load(f)
+    @pytest.mark.parametrize("json_module", ["json", "orjson", "ujson"])
+    def test_saved_file_parses_with_any_backend(self, tmp_path, json_module):
+        """Test that saved files read back identically with every JSON library."""
+        loads = pytest.importorskip(json_module).loads
+        storage_file = tmp_path / "repos.json"
+        storage = RepoStorage(str(storage_file))
+        repos = [{
+            "owner": "owner1",
+            "name": "caf\u00e9",
+            "full_name": "owner1/caf\u00e9",
+            "url": "https://github.com/owner1/caf\u00e9",
+            "description": "Quotes \" and \\ backslashes",
+        }]
 
-        assert content == []
+        storage.save_repos(repos)
+
+        assert loads(storage_file.read_bytes()) == repos
 
     def test_merge_repos_new_and_existing(self, tmp_path):
         """Test merging new repos with existing ones."""
@@ -161,3 +178,172 @@ class TestRepoStorage:
 
         assert saved_repos[0].get("source") == source_url
         assert "scraped_at" in saved_repos[0]
+
+    def test_load_repos_reuses_parse_until_file_changes(self, tmp_path, mocker):
+        """Test that repeat loads skip parsing and still see external edits."""
+        storage_file = tmp_path / "test_repos.json"
+        storage = RepoStorage(str(storage_file))
+        storage.save_repos([{"full_name": "owner1/repo1"}])
+
+        json_load = mocker.spy(storage_module, "_loads")
+
+        first = storage.load_repos()
+        first[0]["description"] = "mutated"
+        second = storage.load_repos()
+
+        assert second[0]["full_name"] == "owner1/repo1"
+        assert "description" not in second[0]
+        assert json_load.call_count == 1
+
+        storage_file.write_text(json.dumps([{"full_name": "owner2/repo2"}, {"full_name": "owner3/repo3"}]))
+
+        assert [r["full_name"] for r in storage.load_repos()] == ["owner2/repo2", "owner3/repo3"]
+        assert json_load.call_count == 2
+
+
+class TestSqliteRepoStorage:
+    """Test cases for SqliteRepoStorage class."""
+
+    def test_save_and_load_repos(self, tmp_path):
+        """Test that repos round-trip through the database in order."""
+        storage = SqliteRepoStorage(str(tmp_path / "repos.db"))
+
+        repos = [
+            {"owner": "user1", "name": "repo1", "full_name": "user1/repo1"},
+            {"owner": "user2", "name": "repo2", "full_name": "user2/repo2"},
+        ]
+
+        storage.save_repos(repos, source="https://github.com/awesome/list")
+
+        loaded = storage.load_repos()
+
+        assert [r["full_name"] for r in loaded] == ["user1/repo1", "user2/repo2"]
+        assert loaded[0]["source"] == "https://github.com/awesome/list"
+        assert "scraped_at" in loaded[0]
+
+    def test_merge_upserts_and_keeps_existing_fields(self, tmp_path):
+        """Test that merging updates in place like RepoStorage does."""
+        storage = SqliteRepoStorage(str(tmp_path / "repos.db"))
+
+        storage.save_repos([
+            {"full_name": "user1/repo1", "description": "Old", "stars": "5"},
+            {"full_name": "user2/repo2"},
+        ])
+        storage.save_repos([
+            {"full_name": "user3/repo3"},
+            {"full_name": "user1/repo1", "description": "Updated"},
+        ], merge=True)
+
+        loaded = storage.load_repos()
+
+        assert [r["full_name"] for r in loaded] == ["user1/repo1", "user2/repo2", "user3/repo3"]
+        assert loaded[0]["description"] == "Updated"
+        assert loaded[0]["stars"] == "5"
+
+    def test_merge_keeps_fields_set_to_none(self, tmp_path):
+        """Test that a None value is stored as null rather than deleting the field."""
+        storage = SqliteRepoStorage(str(tmp_path / "repos.db"))
+
+        storage.save_repos([{"full_name": "user1/repo1", "description": "Old", "stars": "5"}])
+        storage.save_repos([{"full_name": "user1/repo1", "description": None}], merge=True)
+
+        loaded = storage.load_repos()
+
+        assert loaded[0]["description"] is None
+        assert loaded[0]["stars"] == "5"
+
+    def test_save_without_merge_overwrites(self, tmp_path):
+        """Test that saving without merge replaces all repos."""
+        storage = SqliteRepoStorage(str(tmp_path / "repos.db"))
+
+        storage.save_repos([{"full_name": "user1/repo1"}])
+        storage.save_repos([{"full_name": "user2/repo2"}])
+
+        assert [r["full_name"] for r in storage.load_repos()] == ["user2/repo2"]
+
+    def test_load_nonexistent_file(self, tmp_path):
+        """Test loading when the database doesn't exist."""
+        storage = SqliteRepoStorage(str(tmp_path / "missing.db"))
+
+        assert not storage.exists()
+        assert storage.load_repos() == []
+
+
+class TestJsonlRepoStorage:
+    """Test cases for JsonlRepoStorage class."""
+
+    def test_merge_appends_and_keeps_existing_fields(self, tmp_path):
+        """Test that a merge appends records and loads the latest of each."""
+        storage_file = tmp_path / "repos.jsonl"
+        storage = JsonlRepoStorage(str(storage_file))
+
+        storage.save_repos([
+            {"full_name": "user1/repo1", "description": "Old", "stars": "5"},
+            {"full_name": "user2/repo2"},
+            {"full_name": "user4/repo4"},
+        ])
+
+        storage.save_repos([
+            {"full_name": "user3/repo3"},
+            {"full_name": "user1/repo1", "description": "Updated"},
+        ], merge=True)
+
+        assert len(storage_file.read_bytes().splitlines()) == 5
+
+        loaded = storage.load_repos()
+
+        assert [r["full_name"] for r in loaded] == [
+            "user1/repo1", "user2/repo2", "user4/repo4", "user3/repo3"
+        ]
+        assert loaded[0]["description"] == "Updated"
+        assert loaded[0]["stars"] == "5"
+
+    def test_json_storage_reads_jsonl_files(self, tmp_path):
+        """Test that RepoStorage loads a JSON lines file like JsonlRepoStorage does."""
+        storage_file = tmp_path / "repos.jsonl"
+        storage = JsonlRepoStorage(str(storage_file))
+
+        storage.save_repos([{"full_name": "user1/repo1", "description": "Old"}, {"full_name": "user2/repo2"}])
+        storage.save_repos([{"full_name": "user1/repo1", "description": "Updated"}], merge=True)
+
+        assert RepoStorage(str(storage_file)).load_repos() == storage.load_repos()
+
+    def test_rebuilds_stale_index(self, tmp_path):
+        """Test that a missing index is rebuilt from the data file."""
+        storage = JsonlRepoStorage(str(tmp_path / "repos.jsonl"))
+
+        storage.save_repos([{"full_name": "user1/repo1"}])
+        storage.save_repos([{"full_name": "user1/repo1", "description": "New"}], merge=True)
+        storage.index_path.unlink()
+
+        loaded = storage.load_repos()
+
+        assert len(loaded) == 1
+        assert loaded[0]["description"] == "New"
+
+    def test_compacts_superseded_records(self, tmp_path):
+        """Test that the file is rewritten once stale records dominate."""
+        storage_file = tmp_path / "repos.jsonl"
+        storage = JsonlRepoStorage(str(storage_file))
+
+        storage.save_repos([{"full_name": "user1/repo1", "n": 0}])
+        for n in range(1, 4):
+            storage.save_repos([{"full_name": "user1/repo1", "n": n}], merge=True)
+
+        assert len(storage_file.read_bytes().splitlines()) <= 2
+        assert storage.load_repos()[0]["n"] == 3
+
+
+@pytest.mark.parametrize("name, backend", [
+    ("repos.json", RepoStorage),
+    ("repos.jsonl", JsonlRepoStorage),
+    ("repos.db", SqliteRepoStorage),
+])
+def test_open_storage_picks_backend_by_extension(tmp_path, monkeypatch, name, backend):
+    """Test that open_storage honours SKILL_SCRAPER_STORAGE and the file extension."""
+    monkeypatch.setenv("SKILL_SCRAPER_STORAGE", str(tmp_path / name))
+
+    storage = open_storage()
+
+    assert type(storage) is backend
+    assert storage.storage_path == tmp_path / name
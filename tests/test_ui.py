@@ -1,26 +1,45 @@
 """Tests for ui module."""
 
+import io
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from rich.console import Console
 from ui import RepoSelector
 
 
+@pytest.fixture(scope="module")
+def selector():
+    """A RepoSelector shared across tests; it holds no per-prompt state."""
+    return RepoSelector()
+
+
+@pytest.fixture
+def mock_prompt(monkeypatch):
+    """Replace a questionary prompt so its ``.ask()`` returns a fixed answer."""
+    def make(kind, answer):
+        prompt = MagicMock()
+        prompt.return_value.ask.return_value = answer
+        monkeypatch.setattr(f"ui.questionary.{kind}", prompt)
+        return prompt
+
+    return make
+
+
 class TestRepoSelector:
     """Test cases for RepoSelector class."""
 
-    def test_select_repos_empty_list(self):
+    def test_select_repos_empty_list(self, selector):
         """Test selecting from empty repository list."""
-        selector = RepoSelector()
-
         result = selector.select_repos([])
 
         assert result == []
 
-    @patch('ui.questionary.checkbox')
-    def test_select_repos_with_repositories(self, mock_checkbox):
+    def test_select_repos_with_repositories(self, selector, mock_prompt):
         """Test selecting repositories with valid list."""
-        selector = RepoSelector()
-
         test_repos = [
             {
                 "owner": "owner1",
@@ -38,19 +57,15 @@ class TestRepoSelector:
             }
         ]
 
-        mock_ask = MagicMock(return_value=[test_repos[0]])
-        mock_checkbox.return_value.ask = mock_ask
+        mock_prompt("checkbox", [test_repos[0]])
 
         result = selector.select_repos(test_repos)
 
         assert len(result) == 1
         assert result[0]["full_name"] == "owner1/repo1"
 
-    @patch('ui.questionary.checkbox')
-    def test_select_repos_cancelled(self, mock_checkbox):
+    def test_select_repos_cancelled(self, selector, mock_prompt):
         """Test cancelling repository selection."""
-        selector = RepoSelector()
-
         test_repos = [
             {
                 "owner": "owner1",
@@ -61,18 +76,14 @@ class TestRepoSelector:
             }
         ]
 
-        mock_ask = MagicMock(return_value=None)
-        mock_checkbox.return_value.ask = mock_ask
+        mock_prompt("checkbox", None)
 
         result = selector.select_repos(test_repos)
 
         assert result == []
 
-    @patch('ui.questionary.checkbox')
-    def test_select_repos_truncates_long_description(self, mock_checkbox):
+    def test_select_repos_truncates_long_description(self, selector, mock_prompt):
         """Test that long descriptions are truncated."""
-        selector = RepoSelector()
-
         long_description = "A" * 100
 
         test_repos = [
@@ -85,125 +96,131 @@ class TestRepoSelector:
             }
         ]
 
-        mock_ask = MagicMock(return_value=[test_repos[0]])
-        mock_checkbox.return_value.ask = mock_ask
+        mock_prompt("checkbox", [test_repos[0]])
 
         result = selector.select_repos(test_repos)
 
         assert len(result) == 1
 
-    @patch('ui.questionary.confirm')
-    def test_confirm_action_yes(self, mock_confirm):
-        """Test confirming action."""
-        selector = RepoSelector()
+    def test_choice_title_falls_back_for_missing_description(self):
+        """Test that missing and null descriptions get the same placeholder."""
+        repo = {"full_name": "owner1/repo1"}
+
+        assert RepoSelector._choice_title(repo, None) == "owner1/repo1: No description"
+        assert RepoSelector._choice_title({**repo, "description": None}, None) == (
+            "owner1/repo1: No description"
+        )
+
+    def test_select_repos_large_list_uses_windowed_prompt(self, selector, mock_prompt):
+        """Test that long lists are selected through the windowed checkbox."""
+        test_repos = [
+            {
+                "owner": "owner",
+                "name": f"repo{i}",
+                "full_name": f"owner/repo{i}",
+                "url": f"https://github.com/owner/repo{i}",
+            }
+            for i in range(RepoSelector._WINDOWED_CHECKBOX_MIN + 50)
+        ]
 
-        mock_ask = MagicMock(return_value=True)
-        mock_confirm.return_value.ask = mock_ask
+        checkbox = mock_prompt("checkbox", [])
+
+        with create_pipe_input() as pipe:
+            # Toggle the first row, move down twice and toggle, then page down and toggle.
+            pipe.send_text(" \x1b[B\x1b[B \x1b[6~ \r")
+            with create_app_session(input=pipe, output=DummyOutput()):
+                result = selector.select_repos(test_repos)
+
+        checkbox.assert_not_called()
+        assert [r["name"] for r in result[:2]] == ["repo0", "repo2"]
+        assert len(result) == 3
+
+    def test_windowed_prompt_inverts_selection(self, selector):
+        """Test that 'i' inverts the windowed checkbox selection like questionary's."""
+        titles = [f"repo{i}" for i in range(5)]
+
+        with create_pipe_input() as pipe:
+            # Toggle the first row, invert, then confirm.
+            pipe.send_text(" i\r")
+            with create_app_session(input=pipe, output=DummyOutput()):
+                result = selector._windowed_checkbox("Pick", titles, titles)
+
+        assert result == ["repo1", "repo2", "repo3", "repo4"]
+
+    def test_confirm_action_yes(self, selector, mock_prompt):
+        """Test confirming action."""
+        mock_prompt("confirm", True)
 
         result = selector.confirm_action("Test message?")
 
         assert result is True
 
-    @patch('ui.questionary.confirm')
-    def test_confirm_action_no(self, mock_confirm):
+    def test_confirm_action_no(self, selector, mock_prompt):
         """Test declining action."""
-        selector = RepoSelector()
-
-        mock_ask = MagicMock(return_value=False)
-        mock_confirm.return_value.ask = mock_ask
+        mock_prompt("confirm", False)
 
         result = selector.confirm_action("Test message?")
 
         assert result is False
 
-    @patch('ui.questionary.confirm')
-    def test_confirm_action_cancelled(self, mock_confirm):
+    def test_confirm_action_cancelled(self, selector, mock_prompt):
         """Test cancelling confirm action."""
-        selector = RepoSelector()
-
-        mock_ask = MagicMock(return_value=None)
-        mock_confirm.return_value.ask = mock_ask
+        mock_prompt("confirm", None)
 
         result = selector.confirm_action("Test message?")
 
         assert result is False
 
-    @patch('ui.questionary.select')
-    def test_select_action_scrape(self, mock_select):
+    def test_select_action_scrape(self, selector, mock_prompt):
         """Test selecting scrape action."""
-        selector = RepoSelector()
-
-        mock_ask = MagicMock(return_value="scrape")
-        mock_select.return_value.ask = mock_ask
+        mock_prompt("select", "scrape")
 
         result = selector.select_action()
 
         assert result == "scrape"
 
-    @patch('ui.questionary.select')
-    def test_select_action_load(self, mock_select):
+    def test_select_action_load(self, selector, mock_prompt):
         """Test selecting load action."""
-        selector = RepoSelector()
-
-        mock_ask = MagicMock(return_value="load")
-        mock_select.return_value.ask = mock_ask
+        mock_prompt("select", "load")
 
         result = selector.select_action()
 
         assert result == "load"
 
-    @patch('ui.questionary.select')
-    def test_select_action_exit(self, mock_select):
+    def test_select_action_exit(self, selector, mock_prompt):
         """Test selecting exit action."""
-        selector = RepoSelector()
-
-        mock_ask = MagicMock(return_value="exit")
-        mock_select.return_value.ask = mock_ask
+        mock_prompt("select", "exit")
 
         result = selector.select_action()
 
         assert result == "exit"
 
-    @patch('ui.questionary.select')
-    def test_select_action_cancelled(self, mock_select):
+    def test_select_action_cancelled(self, selector, mock_prompt):
         """Test cancelling action selection."""
-        selector = RepoSelector()
-
-        mock_ask = MagicMock(return_value=None)
-        mock_select.return_value.ask = mock_ask
+        mock_prompt("select", None)
 
         result = selector.select_action()
 
         assert result == "exit"
 
-    @patch('ui.questionary.text')
-    def test_get_github_url_valid(self, mock_text):
+    def test_get_github_url_valid(self, selector, mock_prompt):
         """Test getting valid GitHub URL."""
-        selector = RepoSelector()
-
-        mock_ask = MagicMock(return_value="https://github.com/owner/repo")
-        mock_text.return_value.ask = mock_ask
+        mock_prompt("text", "https://github.com/owner/repo")
 
         result = selector.get_github_url()
 
         assert result == "https://github.com/owner/repo"
 
-    @patch('ui.questionary.text')
-    def test_get_github_url_cancelled(self, mock_text):
+    def test_get_github_url_cancelled(self, selector, mock_prompt):
         """Test cancelling GitHub URL input."""
-        selector = RepoSelector()
-
-        mock_ask = MagicMock(return_value=None)
-        mock_text.return_value.ask = mock_ask
+        mock_prompt("text", None)
 
         result = selector.get_github_url()
 
         assert result == ""
 
-    def test_show_summary(self, capsys):
+    def test_show_summary(self, selector, capsys):
         """Test showing installation summary."""
-        selector = RepoSelector()
-
         selector.show_summary(total=10, successful=8, failed=2)
 
         captured = capsys.readouterr()
@@ -215,3 +232,27 @@ class TestRepoSelector:
         assert "8" in captured.out
         assert "Failed" in captured.out
         assert "2" in captured.out
+
+    def test_show_summary_renders_table_on_terminal(self):
+        """Test that terminals get the rendered summary table."""
+        selector = RepoSelector()
+        selector.console = Console(file=io.StringIO(), force_terminal=True, width=80)
+
+        selector.show_summary(total=10, successful=8, failed=2)
+
+        output = selector.console.file.getvalue()
+
+        assert "✨ Installation Summary" in output
+        assert "Total selected: 10" not in output
+
+    def test_print_status_renders_markup(self):
+        """Test that status markup is rendered and repeats print identically."""
+        selector = RepoSelector()
+        selector.console = Console(file=io.StringIO(), force_terminal=True, width=80)
+
+        selector.print_status("✓ Found [green]3[/green] repositories", style="bold")
+        first = selector.console.file.getvalue()
+        selector.print_status("✓ Found [green]3[/green] repositories", style="bold")
+
+        assert selector.console.file.getvalue() == first * 2
+        assert "[green]" not in first
@@ -1,25 +1,49 @@
 """Terminal UI for repository selection."""
 
-from typing import List, Dict, Optional
+import shutil
+from typing import Any, List, Dict, Optional, Set
 
 import questionary
 from questionary import Choice
 from loguru import logger
+from prompt_toolkit.application import Application
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout import FormattedTextControl, Layout, Window
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich import box
 from rich.text import Text
 
 from config import ExtractionConfig
+from skill_detector import count_skill_repos
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Clip text to ``limit`` characters, ending with an ellipsis when cut."""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
 
 
 class RepoSelector:
     """Interactive terminal UI for selecting repositories."""
 
+    # Above this many choices, questionary's re-render of every row on each
+    # keypress becomes noticeable, so only the visible window is drawn.
+    _WINDOWED_CHECKBOX_MIN = 200
+
+    # Shown above every checkbox prompt; built once rather than parsed from
+    # markup on each print.
+    _CHECKBOX_HINT = Text(
+        "Use arrow keys to navigate, space to select/deselect, 'a' to toggle all, "
+        "'i' to invert, enter to confirm\n",
+        style="dim"
+    )
+
+    __slots__ = ("console", "_progress_columns")
+
     def __init__(self):
         self.console = Console()
+        self._progress_columns = None
 
     def select_repos(
         self,
@@ -40,34 +64,21 @@ class RepoSelector:
             logger.warning("No repositories to select")
             return []
 
-        choices = []
-
-        for repo in repos:
-            description = repo.get('description', 'No description')
-
-            skill_indicator = ""
-            if detection_results and repo['full_name'] in detection_results:
-                result = detection_results[repo['full_name']]
-                if result.get('is_skill_repo'):
-                    skill_count = result.get('skill_count', 0)
-                    confidence = result.get('confidence', 0)
-                    skill_indicator = f" [🎯 ~{skill_count} skills, {confidence:.0%}]"
+        results = detection_results or {}
+        titles = [self._choice_title(repo, results.get(repo['full_name'])) for repo in repos]
 
-            combined_desc = f"{description}{skill_indicator}"
-            if len(combined_desc) > 80:
-                combined_desc = combined_desc[:77] + "..."
+        with self.console:
+            self._show_repository_summary(repos, detection_results)
+            self.console.print(self._CHECKBOX_HINT)
 
-            choice_name = f"{repo['full_name']}: {combined_desc}"
-            choices.append(Choice(title=choice_name, value=repo))
+        message = "Select repositories to add as Claude skills:"
 
-        self._show_repository_summary(repos, detection_results)
-
-        self.console.print("[dim]Use arrow keys to navigate, space to select/deselect, 'a' to toggle all, enter to confirm[/dim]\n")
-
-        selected = questionary.checkbox(
-            "Select repositories to add as Claude skills:",
-            choices=choices,
-        ).ask()
+        if len(repos) > self._WINDOWED_CHECKBOX_MIN:
+            # The windowed prompt reads titles directly, so no Choice objects.
+            selected = self._windowed_checkbox(message, titles, repos)
+        else:
+            choices = [Choice(title=title, value=repo) for title, repo in zip(titles, repos)]
+            selected = questionary.checkbox(message, choices=choices).ask()
 
         if selected is None:
             logger.info("Selection cancelled")
@@ -76,6 +87,97 @@ class RepoSelector:
         logger.info(f"Selected {len(selected)} repositories")
         return selected
 
+    def _windowed_checkbox(
+        self,
+        message: str,
+        titles: List[str],
+        values: List[Any]
+    ) -> Optional[List[Any]]:
+        """
+        Checkbox prompt that formats only the rows currently in view.
+
+        Keys match questionary's checkbox: arrows (or j/k) to move, page
+        up/down to jump, space to toggle, 'a' to toggle all, 'i' to invert
+        the selection, enter to confirm.
+
+        Returns:
+            Values of the checked rows in list order, or None if cancelled
+        """
+        height = max(5, shutil.get_terminal_size().lines - 4)
+        last = len(titles) - 1
+        checked: Set[int] = set()
+        view = {"cursor": 0, "top": 0}
+
+        def render():
+            cursor = view["cursor"]
+            top = min(max(view["top"], cursor - height + 1), cursor)
+            view["top"] = top
+
+            fragments = [
+                ("class:question", f"? {message} "),
+                ("class:instruction", f"({len(checked)}/{len(titles)} selected)\n"),
+            ]
+            for i in range(top, min(top + height, len(titles))):
+                pointer = "»" if i == cursor else " "
+                mark = "●" if i in checked else "○"
+                fragments.append(
+                    ("reverse" if i == cursor else "", f" {pointer} {mark} {titles[i]}\n")
+                )
+            return fragments
+
+        bindings = KeyBindings()
+
+        def move(offset: int):
+            view["cursor"] = min(max(view["cursor"] + offset, 0), last)
+
+        bindings.add("up")(lambda event: move(-1))
+        bindings.add("k")(lambda event: move(-1))
+        bindings.add("down")(lambda event: move(1))
+        bindings.add("j")(lambda event: move(1))
+        bindings.add("pageup")(lambda event: move(-height))
+        bindings.add("pagedown")(lambda event: move(height))
+
+        @bindings.add(" ")
+        def _toggle(event):
+            checked.symmetric_difference_update((view["cursor"],))
+
+        @bindings.add("a")
+        def _toggle_all(event):
+            if len(checked) == len(titles):
+                checked.clear()
+            else:
+                checked.update(range(len(titles)))
+
+        @bindings.add("i")
+        def _invert(event):
+            checked.symmetric_difference_update(range(len(titles)))
+
+        @bindings.add("enter")
+        def _confirm(event):
+            event.app.exit(result=[values[i] for i in sorted(checked)])
+
+        @bindings.add("c-c")
+        def _cancel(event):
+            event.app.exit(result=None)
+
+        app = Application(
+            layout=Layout(Window(FormattedTextControl(render, show_cursor=False))),
+            key_bindings=bindings,
+        )
+        return app.run()
+
+    @staticmethod
+    def _choice_title(repo: Dict[str, str], result: Optional[Dict]) -> str:
+        """Build a repository's checkbox label, truncated to 80 characters."""
+        description = repo.get('description') or 'No description'
+
+        if result and result.get('is_skill_repo'):
+            skill_count = result.get('skill_count', 0)
+            confidence = result.get('confidence', 0)
+            description = f"{description} [🎯 ~{skill_count} skills, {confidence:.0%}]"
+
+        return f"{repo['full_name']}: {_truncate(description, 80)}"
+
     def confirm_action(self, message: str) -> bool:
         """
         Ask for confirmation.
@@ -153,21 +255,17 @@ class RepoSelector:
         if mode is None:
             mode = "metadata"
 
-        config = ExtractionConfig(mode=mode)
+        options = {"mode": mode}
 
         if mode in ["extract", "both"]:
-            config.confirm_extraction = self.confirm_action(
+            options["confirm_extraction"] = self.confirm_action(
                 "Ask for confirmation before extracting skills from each repository?"
             )
-
-            install_location = self.select_installation_location()
-            config.install_location = install_location
-
-            selection_mode = self.select_selection_mode()
-            config.selection_mode = selection_mode
+            options["install_location"] = self.select_installation_location()
+            options["selection_mode"] = self.select_selection_mode()
 
         logger.info(f"Extraction mode selected: {mode}")
-        return config
+        return ExtractionConfig(**options)
 
     def select_installation_location(self) -> str:
         """
@@ -283,18 +381,18 @@ class RepoSelector:
             logger.warning("No staged skills to review")
             return []
 
-        self._show_staged_skills_summary(staged_skills)
-
-        self.console.print("[dim]Use arrow keys to navigate, space to select/deselect, 'a' to toggle all, enter to confirm[/dim]\n")
+        with self.console:
+            self._show_staged_skills_summary(staged_skills)
+            self.console.print(self._CHECKBOX_HINT)
 
-        choices = []
-        for skill in staged_skills:
-            description = skill.get('description', 'No description available')
-            if len(description) > 100:
-                description = description[:97] + "..."
-
-            choice_name = f"{skill['skill_name']}\n   {description}"
-            choices.append(Choice(title=choice_name, value=skill))
+        choices = [
+            Choice(
+                title=f"{skill['skill_name']}\n   "
+                      f"{_truncate(skill.get('description') or 'No description available', 100)}",
+                value=skill
+            )
+            for skill in staged_skills
+        ]
 
         selected = questionary.checkbox(
             f"Select skills to install ({len(staged_skills)} available):",
@@ -310,8 +408,15 @@ class RepoSelector:
 
     def _show_staged_skills_summary(self, staged_skills: List[Dict[str, str]]):
         """Display summary of staged skills with Rich formatting."""
+        count = len(staged_skills)
+
+        if not self.console.is_terminal:
+            # Piped output gets a plain line instead of a rendered table.
+            self.console.out(f"Extracted {count} skills, ready for review", highlight=False)
+            return
+
         table = Table(
-            title=f"🎯 Extracted {len(staged_skills)} Skills - Ready for Review",
+            title=f"🎯 Extracted {count} Skills - Ready for Review",
             box=box.DOUBLE,
             show_header=True
         )
@@ -321,21 +426,21 @@ class RepoSelector:
 
         for skill in staged_skills[:10]:
             skill_name = skill.get('skill_name', skill['name'])
-            description = skill.get('description', 'No description available')
-            if len(description) > 80:
-                description = description[:77] + "..."
+            description = _truncate(skill.get('description') or 'No description available', 80)
 
             table.add_row(skill_name, description)
 
-        if len(staged_skills) > 10:
+        if count > 10:
             table.add_row(
-                f"[dim]... and {len(staged_skills) - 10} more[/dim]",
+                f"[dim]... and {count - 10} more[/dim]",
                 "[dim]Review all in selection below[/dim]"
             )
 
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print("\n")
+        # Rendered into one buffer and written to the terminal on exit.
+        with self.console:
+            self.console.print("\n")
+            self.console.print(table)
+            self.console.print("\n")
 
     def confirm_skill_extraction(
         self,
@@ -365,18 +470,26 @@ class RepoSelector:
 
     def _show_repository_summary(self, repos: List[Dict], detection_results: Optional[Dict] = None):
         """Display repository summary with Rich formatting."""
+        skill_repos = 0
+        if detection_results:
+            skill_repos = count_skill_repos(detection_results)
+
+        if not self.console.is_terminal:
+            detected = f", {skill_repos} skill repositories detected" if skill_repos else ""
+            self.console.out(f"Found {len(repos)} repositories{detected}", highlight=False)
+            return
+
         table = Table(title=f"📦 Found {len(repos)} Repositories", box=box.ROUNDED, show_header=False)
 
         table.add_column("Info", style="cyan", no_wrap=False)
 
-        if detection_results:
-            skill_repos = sum(1 for r in detection_results.values() if r.get('is_skill_repo'))
-            if skill_repos > 0:
-                table.add_row(f"[green]🎯 Detected {skill_repos} skill repositories[/green]")
+        if skill_repos > 0:
+            table.add_row(f"[green]🎯 Detected {skill_repos} skill repositories[/green]")
 
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print("\n")
+        with self.console:
+            self.console.print("\n")
+            self.console.print(table)
+            self.console.print("\n")
 
     def show_summary(
         self,
@@ -402,46 +515,72 @@ class RepoSelector:
             "both": "🎯 Smart Mode (Metadata + Extract)"
         }
 
-        table = Table(title="✨ Installation Summary", box=box.DOUBLE, show_header=True)
-        table.add_column("Metric", style="cyan", no_wrap=True)
-        table.add_column("Count", justify="right", style="magenta")
-
-        table.add_row("Total selected", str(total))
-        table.add_row("Successfully added", f"[green]{successful}[/green]")
+        # (metric, value, rich style for the value)
+        rows = [
+            ("Total selected", str(total), ""),
+            ("Successfully added", str(successful), "green"),
+        ]
 
         if extraction_mode and extraction_mode in ["extract", "both"]:
-            table.add_row("Skills extracted", f"[yellow]{extracted}[/yellow]")
+            rows.append(("Skills extracted", str(extracted), "yellow"))
 
-        if failed > 0:
-            table.add_row("Failed", f"[red]{failed}[/red]")
-        else:
-            table.add_row("Failed", "0")
+        rows.append(("Failed", str(failed), "red" if failed > 0 else ""))
 
         if extraction_mode:
-            table.add_row("Mode", mode_labels.get(extraction_mode, extraction_mode))
+            rows.append(("Mode", mode_labels.get(extraction_mode, extraction_mode), ""))
+
+        if not self.console.is_terminal:
+            self.console.out(
+                "Installation Summary",
+                *(f"{metric}: {value}" for metric, value, _ in rows),
+                sep="\n",
+                highlight=False
+            )
+            return
+
+        table = Table(title="✨ Installation Summary", box=box.DOUBLE, show_header=True)
+        table.add_column("Metric", style="cyan", no_wrap=True)
+        table.add_column("Count", justify="right", style="magenta")
+
+        for metric, value, style in rows:
+            table.add_row(metric, f"[{style}]{value}[/{style}]" if style else value)
 
-        self.console.print("\n")
-        self.console.print(table)
-        self.console.print("\n")
+        with self.console:
+            self.console.print("\n")
+            self.console.print(table)
+            self.console.print("\n")
 
-    def show_progress(self, description: str, total: int):
+    def show_progress(self, description: str):
         """
         Create a progress bar for long operations.
 
+        The bar starts with no tasks; callers add one with
+        ``progress.add_task(label, total=...)``. A task without a total
+        renders as an indeterminate bar, so iterables never need counting
+        up front.
+
         Args:
             description: Description of the operation
-            total: Total number of items to process
 
         Returns:
             Progress context manager
         """
-        return Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console
-        )
+        # Only needed once work starts, so kept off the import path.
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
+        # Columns hold no per-task state, so every bar reuses the same set.
+        if self._progress_columns is None:
+            self._progress_columns = (
+                SpinnerColumn(),
+                TextColumn("[bold blue]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+            )
+
+        # Rich's refresh thread redraws on a timer whatever the update rate
+        # (10 Hz by default); four redraws a second keep the per-repository
+        # counts readable while writing to the terminal less often.
+        return Progress(*self._progress_columns, console=self.console, refresh_per_second=4)
 
     def print_status(self, message: str, style: str = ""):
         """Print a status message with Rich formatting."""